@@ -14,12 +14,7 @@ def main():
     transcription_service = TranscriptionService()
     config = SecureConfig(config_dir=".config")
 
-    # Try to load saved API key
-    saved_key = config.load_api_key()
-    if saved_key:
-        transcription_service.set_api_key(saved_key)
-
-    # Run Streamlit app
+    # Run Streamlit app (the saved API key is loaded once per session)
     create_streamlit_app(recorder, file_manager, transcription_service, config)
 
 
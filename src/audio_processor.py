@@ -3,7 +3,9 @@
 import os
 import subprocess
 import shutil
-from typing import List, Tuple, Optional, Callable
+import shlex
+from itertools import chain
+from typing import List, Tuple, Optional, Callable, Iterable, Iterator
 from pydub import AudioSegment
 import tempfile
 
@@ -48,6 +50,17 @@ COMPRESSION_METHODS = {
     }
 }
 
+# FFmpeg muxer and MIME type per output extension, for writing to a pipe
+# (there is no output file name for FFmpeg to infer the container from)
+STREAM_FORMATS = {
+    ".opus": ("ogg", "audio/ogg"),
+    ".mp3": ("mp3", "audio/mpeg"),
+}
+
+
+# Target size for stream-copied chunks, safely under the 25 MB API upload limit
+MAX_COPY_CHUNK_BYTES = 20 * 1024 * 1024
+
 
 class AudioProcessor:
     """Handle audio compression and chunking for long files."""
@@ -100,6 +113,47 @@ class AudioProcessor:
         except Exception as e:
             return False, "", f"Error compressing audio: {str(e)}"
 
+    def compress_audio_stream(
+        self,
+        input_path: str,
+        method: str = "recommended",
+        custom_ffmpeg_options: Optional[str] = None
+    ) -> subprocess.Popen:
+        """
+        Start FFmpeg compressing to its stdout instead of an output file.
+
+        The caller reads the encoded audio from process.stdout (e.g. to upload it
+        without a temp file), then closes it and waits on the process to check the exit code.
+
+        Args:
+            input_path: Input audio file path
+            method: Compression method ("recommended", "fast_mp3", "balanced_opus", "custom")
+            custom_ffmpeg_options: Custom FFmpeg options (used when method="custom")
+
+        Returns:
+            The running FFmpeg process (stdout and stderr are pipes)
+
+        Raises:
+            Exception: If FFmpeg is missing or the method/options are invalid
+        """
+        if not shutil.which("ffmpeg"):
+            raise Exception("FFmpeg not found. Please install FFmpeg to use compression.")
+
+        ffmpeg_options = self._get_ffmpeg_options(method, custom_ffmpeg_options)
+        extension = COMPRESSION_METHODS.get(method, COMPRESSION_METHODS["custom"])["extension"]
+        muxer, _ = STREAM_FORMATS[extension]
+
+        cmd = [
+            "ffmpeg",
+            "-loglevel", "error",  # Keep stderr small since it is only read at the end
+            "-i", input_path,
+            *ffmpeg_options,
+            "-f", muxer,
+            "pipe:1"
+        ]
+
+        return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
     def _compress_with_ffmpeg(
         self,
         input_path: str,
@@ -118,18 +172,10 @@ class AudioProcessor:
                 progress_callback("Compressing with FFmpeg (streaming mode)...")
 
             # Get FFmpeg options based on method
-            if method == "custom":
-                if not custom_ffmpeg_options:
-                    return False, "", "Custom FFmpeg options not provided"
-                ffmpeg_options_str = custom_ffmpeg_options
-            elif method in COMPRESSION_METHODS:
-                ffmpeg_options_str = COMPRESSION_METHODS[method]["ffmpeg_options"]
-            else:
-                return False, "", f"Unknown compression method: {method}"
-
-            # Parse FFmpeg options string into list
-            import shlex
-            ffmpeg_options = shlex.split(ffmpeg_options_str)
+            try:
+                ffmpeg_options = self._get_ffmpeg_options(method, custom_ffmpeg_options)
+            except ValueError as e:
+                return False, "", str(e)
 
             # Construct FFmpeg command
             cmd = [
@@ -181,12 +227,220 @@ class AudioProcessor:
         except Exception as e:
             return False, "", f"Compression error: {str(e)}"
 
+    @staticmethod
+    def _get_ffmpeg_options(method: str, custom_ffmpeg_options: Optional[str]) -> List[str]:
+        """
+        Resolve the FFmpeg options for a compression method.
+
+        Raises:
+            ValueError: If the method is unknown or custom options are missing
+        """
+        if method == "custom":
+            if not custom_ffmpeg_options:
+                raise ValueError("Custom FFmpeg options not provided")
+            ffmpeg_options_str = custom_ffmpeg_options
+        elif method in COMPRESSION_METHODS:
+            ffmpeg_options_str = COMPRESSION_METHODS[method]["ffmpeg_options"]
+        else:
+            raise ValueError(f"Unknown compression method: {method}")
+
+        # Parse FFmpeg options string into list
+        return shlex.split(ffmpeg_options_str)
+
+    @staticmethod
+    def get_chunk_windows(
+        total_duration: float,
+        chunk_duration: int = 1200,
+        overlap_duration: int = 30
+    ) -> List[Tuple[float, float]]:
+        """
+        Compute overlapping chunk windows for an audio file.
+
+        Args:
+            total_duration: Audio duration in seconds
+            chunk_duration: Duration of each chunk in seconds
+            overlap_duration: Overlap duration in seconds
+
+        Returns:
+            List of (start, end) tuples in seconds
+        """
+        step = chunk_duration - overlap_duration
+        windows = []
+
+        start = 0.0
+        while start < total_duration:
+            windows.append((start, min(start + chunk_duration, total_duration)))
+            start += step
+
+        return windows
+
+    def compress_audio_chunks(
+        self,
+        input_path: str,
+        total_duration: float,
+        method: str = "recommended",
+        custom_ffmpeg_options: Optional[str] = None,
+        chunk_duration: int = 1200,
+        overlap_duration: int = 30,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        output_dir: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Compress overlapping windows of an audio file into separate chunk files.
+
+        Each chunk is produced by its own FFmpeg call that seeks into the input, so
+        callers can start consuming (e.g. transcribing) a chunk while the next one
+        is still being compressed.
+
+        Args:
+            input_path: Input audio file path
+            total_duration: Audio duration in seconds
+            method: Compression method (see COMPRESSION_METHODS)
+            custom_ffmpeg_options: Custom FFmpeg options (used when method="custom")
+            chunk_duration: Duration of each chunk in seconds
+            overlap_duration: Overlap duration in seconds
+            progress_callback: Optional callback(current, total, message)
+            output_dir: Directory for chunk files (defaults to the system temp dir)
+
+        Yields:
+            Compressed chunk file paths, in order
+        """
+        if not shutil.which("ffmpeg"):
+            raise Exception("FFmpeg not found. Please install FFmpeg to use compression.")
+
+        ffmpeg_options = self._get_ffmpeg_options(method, custom_ffmpeg_options)
+        extension = COMPRESSION_METHODS.get(method, COMPRESSION_METHODS["custom"])["extension"]
+        windows = self.get_chunk_windows(total_duration, chunk_duration, overlap_duration)
+
+        return self._export_windows(
+            input_path, windows, ffmpeg_options, extension, "Compressing",
+            progress_callback, output_dir
+        )
+
+    @staticmethod
+    def get_size_limited_chunking(
+        total_duration: float,
+        size_bytes: int,
+        max_chunk_bytes: int = MAX_COPY_CHUNK_BYTES,
+        overlap_duration: int = 30,
+        max_chunk_duration: int = 1200
+    ) -> Tuple[int, int]:
+        """
+        Get the longest chunk duration whose stream-copied chunks stay under max_chunk_bytes.
+
+        Assumes a roughly constant bitrate, which holds for the PCM and constant
+        bitrate files that are large enough to need this. The overlap is shrunk to at
+        most a quarter of the chunk so short chunks don't overlap almost entirely.
+
+        Args:
+            total_duration: Audio duration in seconds
+            size_bytes: Audio file size in bytes
+            max_chunk_bytes: Size limit per chunk
+            overlap_duration: Requested overlap duration in seconds
+            max_chunk_duration: Upper bound on the chunk duration in seconds
+
+        Returns:
+            Tuple of (chunk_duration, overlap_duration) in seconds
+        """
+        bytes_per_second = size_bytes / max(total_duration, 1.0)
+        chunk_duration = int(max_chunk_bytes / max(bytes_per_second, 1.0))
+        chunk_duration = max(1, min(chunk_duration, max_chunk_duration))
+        return chunk_duration, min(overlap_duration, chunk_duration // 4)
+
+    def copy_audio_chunks(
+        self,
+        input_path: str,
+        total_duration: float,
+        chunk_duration: int,
+        overlap_duration: int = 30,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        output_dir: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Cut overlapping windows of an audio file into chunk files without re-encoding.
+
+        FFmpeg stream-copies each window (-c copy), which is far cheaper than decoding
+        and re-encoding, so oversized files can be uploaded in pieces as-is. Use
+        get_size_limited_chunking to keep each chunk under the upload limit.
+
+        Args:
+            input_path: Input audio file path
+            total_duration: Audio duration in seconds
+            chunk_duration: Duration of each chunk in seconds
+            overlap_duration: Overlap duration in seconds
+            progress_callback: Optional callback(current, total, message)
+            output_dir: Directory for chunk files (defaults to the system temp dir)
+
+        Yields:
+            Chunk file paths (same container as the input), in order
+        """
+        if not shutil.which("ffmpeg"):
+            raise Exception("FFmpeg not found. Please install FFmpeg to split large files.")
+
+        extension = os.path.splitext(input_path)[1] or ".wav"
+        windows = self.get_chunk_windows(total_duration, chunk_duration, overlap_duration)
+
+        return self._export_windows(
+            input_path, windows, ["-c", "copy"], extension, "Cutting",
+            progress_callback, output_dir
+        )
+
+    def _export_windows(
+        self,
+        input_path: str,
+        windows: List[Tuple[float, float]],
+        output_options: List[str],
+        extension: str,
+        verb: str,
+        progress_callback: Optional[Callable[[int, int, str], None]],
+        output_dir: Optional[str]
+    ) -> Iterator[str]:
+        """Write each (start, end) window of input_path with its own FFmpeg call, yielding paths."""
+        base_name = os.path.splitext(os.path.basename(input_path))[0]
+        total_chunks = len(windows)
+
+        for i, (start, end) in enumerate(windows):
+            if progress_callback:
+                progress_callback(i + 1, total_chunks, f"{verb} chunk {i + 1}/{total_chunks}...")
+
+            fd, chunk_path = tempfile.mkstemp(
+                prefix=f"{base_name}_chunk_{i:03d}_",
+                suffix=extension,
+                dir=output_dir or self.temp_dir
+            )
+            os.close(fd)
+
+            cmd = [
+                "ffmpeg",
+                "-y",  # Overwrite output file
+                "-ss", f"{start:.3f}",  # Seek before input (fast)
+                "-t", f"{end - start:.3f}",
+                "-i", input_path,
+                *output_options,
+                chunk_path
+            ]
+
+            result = subprocess.run(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True
+            )
+
+            if result.returncode != 0:
+                os.remove(chunk_path)
+                error_msg = result.stderr if result.stderr else "Unknown FFmpeg error"
+                raise Exception(f"FFmpeg error on chunk {i + 1}: {error_msg[:200]}")
+
+            yield chunk_path
+
     def split_audio_with_overlap(
         self,
         file_path: str,
         chunk_duration: int = 1200,
         overlap_duration: int = 30,
-        progress_callback: Optional[Callable[[int, int, str], None]] = None
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        output_dir: Optional[str] = None
     ) -> List[str]:
         """
         Split audio into overlapping chunks.
@@ -196,10 +450,39 @@ class AudioProcessor:
             chunk_duration: Duration of each chunk in seconds
             overlap_duration: Overlap duration in seconds
             progress_callback: Optional callback(current, total, message)
+            output_dir: Directory for chunk files (defaults to the system temp dir)
 
         Returns:
             List of chunk file paths
         """
+        return list(self.iter_audio_chunks(
+            file_path, chunk_duration, overlap_duration, progress_callback, output_dir
+        ))
+
+    def iter_audio_chunks(
+        self,
+        file_path: str,
+        chunk_duration: int = 1200,
+        overlap_duration: int = 30,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        output_dir: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Split audio into overlapping chunks, yielding each chunk as soon as it is written.
+
+        Lets callers start consuming (e.g. transcribing) early chunks while later
+        ones are still being exported.
+
+        Args:
+            file_path: Path to audio file
+            chunk_duration: Duration of each chunk in seconds
+            overlap_duration: Overlap duration in seconds
+            progress_callback: Optional callback(current, total, message)
+            output_dir: Directory for chunk files (defaults to the system temp dir)
+
+        Yields:
+            Chunk file paths, in order (just file_path if no split is needed)
+        """
         try:
             # Load audio
             audio = AudioSegment.from_file(file_path)
@@ -207,43 +490,31 @@ class AudioProcessor:
 
             if total_duration <= chunk_duration:
                 # No need to split
-                return [file_path]
+                yield file_path
+                return
 
-            # Calculate chunks
+            # Calculate chunk boundaries
             chunk_duration_ms = chunk_duration * 1000
             overlap_ms = overlap_duration * 1000
             step_ms = chunk_duration_ms - overlap_ms
+            starts = range(0, len(audio), step_ms)
 
-            chunks = []
-            chunk_paths = []
-
-            start = 0
-            chunk_index = 0
-
-            while start < len(audio):
-                end = min(start + chunk_duration_ms, len(audio))
-                chunk = audio[start:end]
-                chunks.append(chunk)
-                start += step_ms
-                chunk_index += 1
-
-            # Save chunks to temp files
+            # Export each chunk to a temp file and hand it over right away
             base_name = os.path.splitext(os.path.basename(file_path))[0]
-            total_chunks = len(chunks)
+            total_chunks = len(starts)
 
-            for i, chunk in enumerate(chunks):
+            for i, start in enumerate(starts):
                 if progress_callback:
                     progress_callback(i + 1, total_chunks, f"Creating chunk {i + 1}/{total_chunks}...")
 
+                chunk = audio[start:min(start + chunk_duration_ms, len(audio))]
                 chunk_path = os.path.join(
-                    self.temp_dir,
+                    output_dir or self.temp_dir,
                     f"{base_name}_chunk_{i:03d}.m4a"
                 )
 
                 chunk.export(chunk_path, format="ipod", codec="aac", bitrate="32k")
-                chunk_paths.append(chunk_path)
-
-            return chunk_paths
+                yield chunk_path
 
         except Exception as e:
             raise Exception(f"Error splitting audio: {str(e)}")
@@ -264,7 +535,7 @@ class AudioProcessor:
 
     def merge_transcriptions(
         self,
-        transcriptions: List[str],
+        transcriptions: Iterable[Optional[str]],
         overlap_duration: int = 30,
         strategy: str = "recommended"
     ) -> str:
@@ -272,30 +543,35 @@ class AudioProcessor:
         Merge overlapping transcriptions using the specified strategy.
 
         Args:
-            transcriptions: List of transcription texts
+            transcriptions: Transcription texts in chunk order (any iterable); None and
+                empty entries (failed chunks) are skipped
             overlap_duration: Overlap duration (for reference)
             strategy: Merge strategy - "recommended" (smart overlap removal) or "simple" (direct concatenation)
 
         Returns:
             Merged transcription text
         """
-        if not transcriptions:
+        chunks = filter(None, transcriptions)
+        first = next(chunks, None)
+        if first is None:
             return ""
 
-        if len(transcriptions) == 1:
-            return transcriptions[0]
+        second = next(chunks, None)
+        if second is None:
+            return first
+        chunks = chain((first, second), chunks)
 
         if strategy == "simple":
-            return self._merge_simple(transcriptions)
+            return self._merge_simple(chunks)
         else:  # "recommended" or default
-            return self._merge_smart(transcriptions, overlap_duration)
+            return self._merge_smart(chunks, overlap_duration)
 
-    def _merge_simple(self, transcriptions: List[str]) -> str:
+    def _merge_simple(self, transcriptions: Iterable[str]) -> str:
         """
         Simple merge: concatenate all transcriptions without overlap removal.
 
         Args:
-            transcriptions: List of transcription texts
+            transcriptions: Transcription texts
 
         Returns:
             Merged transcription text
@@ -303,22 +579,24 @@ class AudioProcessor:
         # Simply join all transcriptions with a space
         return " ".join(t.strip() for t in transcriptions if t.strip())
 
-    def _merge_smart(self, transcriptions: List[str], overlap_duration: int = 30) -> str:
+    def _merge_smart(self, transcriptions: Iterable[str], overlap_duration: int = 30) -> str:
         """
         Smart merge: detect and remove overlapping content using suffix-prefix matching.
 
         Args:
-            transcriptions: List of transcription texts
+            transcriptions: Transcription texts (at least one)
             overlap_duration: Overlap duration (for reference)
 
         Returns:
             Merged transcription text with overlaps removed
         """
+        chunks = iter(transcriptions)
+
         # Start with the first transcription
-        merged = transcriptions[0].strip()
+        merged = next(chunks).strip()
 
-        for i in range(1, len(transcriptions)):
-            current = transcriptions[i].strip()
+        for current in chunks:
+            current = current.strip()
 
             # Find the best overlap between the end of merged and start of current
             best_overlap_len = 0
@@ -3,25 +3,45 @@
 import os
 import shutil
 import json
+import tempfile
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import List, Tuple, Optional, Dict
 
+# Serializes read-modify-write updates of upload indexes (uploads are saved on worker threads)
+_upload_index_lock = threading.Lock()
+
 
 class AudioFileManager:
     """Manage audio files in the recordings directory."""
 
     def __init__(self, recordings_dir: str = "recordings"):
         self.recordings_dir = recordings_dir
+        self.upload_index_file = os.path.join(recordings_dir, ".upload_hashes.json")
+        # Staging area for uploads in progress; on the same filesystem as the
+        # recordings, so a finished upload is renamed into place instead of copied
+        self.incoming_dir = os.path.join(recordings_dir, ".incoming")
         os.makedirs(self.recordings_dir, exist_ok=True)
-
-    def save_uploaded_file(self, uploaded_file_path: str, index: int = 0) -> Tuple[Optional[str], str]:
+        os.makedirs(self.incoming_dir, exist_ok=True)
+
+    def save_uploaded_file(
+        self,
+        uploaded_file_path: str,
+        index: int = 0,
+        content_hash: Optional[str] = None,
+        move: bool = False
+    ) -> Tuple[Optional[str], str]:
         """
         Save an uploaded audio file to the recordings directory.
 
         Args:
             uploaded_file_path: Path to the uploaded file
             index: Index for multiple file uploads (default: 0)
+            content_hash: Optional SHA-256 hex digest of the file, recorded for
+                duplicate detection (see find_duplicate_upload)
+            move: Move the file instead of copying it (a rename when it is already on
+                the recordings filesystem, e.g. staged in incoming_dir)
 
         Returns:
             Tuple of (destination_path, message)
@@ -40,14 +60,74 @@ class AudioFileManager:
             filename = f"upload_{timestamp}_{index:03d}{ext}"
             destination = os.path.join(self.recordings_dir, filename)
 
-            # Copy file to recordings directory
-            shutil.copy2(uploaded_file_path, destination)
+            # Move or copy file to recordings directory
+            if move:
+                shutil.move(uploaded_file_path, destination)
+            else:
+                shutil.copy2(uploaded_file_path, destination)
+
+            if content_hash:
+                try:
+                    with _upload_index_lock:
+                        upload_index = self._load_upload_index()
+                        upload_index[content_hash] = filename
+                        self._write_json_atomic(self.upload_index_file, upload_index)
+                except Exception as e:
+                    print(f"Warning: Could not update upload index: {e}")
 
             return destination, f"File uploaded successfully: {filename}"
 
         except Exception as e:
             return None, f"Error saving file: {str(e)}"
 
+    def find_duplicate_upload(self, content_hash: str) -> Optional[str]:
+        """
+        Find a previously uploaded recording with the same content.
+
+        Args:
+            content_hash: SHA-256 hex digest of the file content
+
+        Returns:
+            Path of the existing recording if it still exists, None otherwise
+        """
+        filename = self._load_upload_index().get(content_hash)
+        if filename:
+            filepath = os.path.join(self.recordings_dir, filename)
+            if os.path.exists(filepath):
+                return filepath
+        return None
+
+    def _load_upload_index(self) -> Dict[str, str]:
+        """Load the content-hash -> filename index of uploaded files."""
+        try:
+            if not os.path.exists(self.upload_index_file):
+                return {}
+
+            with open(self.upload_index_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+
+        except Exception as e:
+            print(f"Error loading upload index: {e}")
+            return {}
+
+    @staticmethod
+    def _write_json_atomic(filepath: str, data: Dict):
+        """
+        Write JSON to a temp file and atomically replace filepath.
+
+        Readers never see a partial file, and the directory mtime changes
+        (used as a cache key by the UI).
+        """
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(filepath) or ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            os.replace(temp_path, filepath)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
     def list_recordings(self) -> List[Tuple[str, str, str]]:
         """
         List all audio files in the recordings directory.
@@ -62,21 +142,24 @@ class AudioFileManager:
 
         # Get all audio files
         audio_extensions = {'.wav', '.mp3', '.m4a', '.flac', '.ogg', '.webm'}
+        entries_with_mtime = []
 
-        for filename in os.listdir(self.recordings_dir):
-            filepath = os.path.join(self.recordings_dir, filename)
+        # scandir yields type info from the directory read, so only matching files are stat'ed
+        with os.scandir(self.recordings_dir) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
 
-            if os.path.isfile(filepath):
-                _, ext = os.path.splitext(filename)
+                _, ext = os.path.splitext(entry.name)
                 if ext.lower() in audio_extensions:
-                    # Get file modification time
-                    mtime = os.path.getmtime(filepath)
-                    formatted_date = datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M:%S")
-
-                    recordings.append((filename, filepath, formatted_date))
+                    entries_with_mtime.append((entry.stat().st_mtime, entry.name, entry.path))
 
         # Sort by modification time (newest first)
-        recordings.sort(key=lambda x: os.path.getmtime(x[1]), reverse=True)
+        entries_with_mtime.sort(key=lambda x: x[0], reverse=True)
+
+        for mtime, filename, filepath in entries_with_mtime:
+            formatted_date = datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M:%S")
+            recordings.append((filename, filepath, formatted_date))
 
         return recordings
 
@@ -118,10 +201,12 @@ class AudioFileManager:
     def get_file_info(self, filepath: str) -> str:
         """Get detailed information about an audio file."""
         try:
-            if not os.path.exists(filepath):
+            # One stat both checks existence and reads size/mtime
+            try:
+                stat = os.stat(filepath)
+            except FileNotFoundError:
                 return "File not found."
 
-            stat = os.stat(filepath)
             size_mb = stat.st_size / (1024 * 1024)
             mtime = datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M:%S")
 
@@ -205,13 +290,18 @@ class AudioFileManager:
             print(f"Error loading transcription: {e}")
             return None
 
-    def has_transcription(self, audio_filepath: str) -> bool:
+    def has_transcription(self, audio_filepath: str, metadata: Optional[Dict] = None) -> bool:
         """
         Check if an audio file has an associated transcription.
         Checks both JSON metadata and legacy .txt file.
+
+        Args:
+            audio_filepath: Path to the audio file
+            metadata: Already-loaded metadata for the file, to avoid reading it again
         """
         # Check JSON metadata first
-        metadata = self.load_metadata(audio_filepath)
+        if metadata is None:
+            metadata = self.load_metadata(audio_filepath)
         if metadata and 'transcription' in metadata and metadata['transcription']:
             return True
 
@@ -225,6 +315,23 @@ class AudioFileManager:
         base_name = os.path.splitext(audio_filepath)[0]
         return f"{base_name}.json"
 
+    def get_metadata_mtime(self, audio_filepath: str) -> float:
+        """
+        Get the modification time of an audio file's metadata JSON.
+
+        Useful as a cache key for data derived from the metadata.
+
+        Args:
+            audio_filepath: Path to the audio file
+
+        Returns:
+            Modification time in seconds (0.0 if no metadata exists)
+        """
+        try:
+            return os.path.getmtime(self._get_metadata_filepath(audio_filepath))
+        except OSError:
+            return 0.0
+
     def load_metadata(self, audio_filepath: str) -> Dict:
         """
         Load metadata for an audio file.
@@ -268,26 +375,27 @@ class AudioFileManager:
             # Add timestamp
             metadata['updated_at'] = datetime.now().isoformat()
 
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            self._write_json_atomic(metadata_file, metadata)
 
             return True, "Metadata saved successfully."
 
         except Exception as e:
             return False, f"Error saving metadata: {str(e)}"
 
-    def get_display_name(self, audio_filepath: str) -> str:
+    def get_display_name(self, audio_filepath: str, metadata: Optional[Dict] = None) -> str:
         """
         Get the display name for an audio file.
         Returns user-defined name if available, otherwise returns filename.
 
         Args:
             audio_filepath: Path to the audio file
+            metadata: Already-loaded metadata for the file, to avoid reading it again
 
         Returns:
             Display name for the file
         """
-        metadata = self.load_metadata(audio_filepath)
+        if metadata is None:
+            metadata = self.load_metadata(audio_filepath)
         return metadata.get('display_name', os.path.basename(audio_filepath))
 
     def set_display_name(self, audio_filepath: str, display_name: str) -> Tuple[bool, str]:
@@ -40,15 +40,21 @@ ReasoningEffort = Literal["minimal", "low", "medium", "high"]
 class MeetingNotesService:
     """Service for converting transcription text to meeting notes using OpenAI API."""
 
-    def __init__(self, api_key: str, prompts_dir: str = "prompts/meeting-notes"):
+    def __init__(
+        self,
+        api_key: str,
+        prompts_dir: str = "prompts/meeting-notes",
+        client: Optional[OpenAI] = None
+    ):
         """
         Initialize the meeting notes service.
 
         Args:
             api_key: OpenAI API key
             prompts_dir: Directory containing prompt templates
+            client: Optional existing client to reuse instead of creating a new one
         """
-        self.client = OpenAI(api_key=api_key)
+        self.client = client if client is not None else OpenAI(api_key=api_key)
         self.prompts_dir = Path(prompts_dir)
 
     def load_prompt(self, prompt_name: str = "default", language: Optional[str] = None) -> str:
@@ -1,13 +1,423 @@
 """Streamlit web UI for AI Meeting Notes."""
 
 import streamlit as st
+import asyncio
+import gc
+import hashlib
+import math
 import os
 import tempfile
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional
+from openai import AsyncOpenAI, OpenAI
+from streamlit.runtime.scriptrunner import add_script_run_ctx
 from src.audio import AudioRecorder
 from src.file_manager import AudioFileManager
-from src.transcription import TranscriptionService
+from src.transcription import (
+    TranscriptionService, AUDIO_MIME_TYPES, MODEL_CHOICES, STREAMING_MODELS,
+    create_async_openai_client, create_openai_client, fingerprint_api_key, warm_up_client
+)
 from src.config import SecureConfig
-from src.audio_processor import AudioProcessor, COMPRESSION_METHODS
+from src.audio_processor import AudioProcessor, COMPRESSION_METHODS, MAX_COPY_CHUNK_BYTES, STREAM_FORMATS
+from src.transcription_cache import TranscriptionCache
+
+
+# Reruns allocate many short-lived objects; move import-time objects (Streamlit, OpenAI,
+# pydub) out of the collector's view and collect less eagerly. Large session results are
+# collected explicitly when released (see release_session_result).
+gc.freeze()
+gc.set_threshold(10_000, 10, 10)
+
+
+# Compression method radio labels, derived once from the static COMPRESSION_METHODS
+_METHOD_LABELS = [info['name'] for info in COMPRESSION_METHODS.values()]
+_METHOD_LABEL_TO_KEY = {info['name']: key for key, info in COMPRESSION_METHODS.items()}
+_METHOD_CAPTIONS = [
+    f"{info['description']} Est. compression: {info['estimated_ratio']} · "
+    f"Speed: {info['speed']} · Memory: {info['memory']}"
+    for info in COMPRESSION_METHODS.values()
+]
+
+# Transcription model ID -> dropdown label, from the static MODEL_CHOICES
+_MODEL_LABELS = {model_id: label for label, model_id in MODEL_CHOICES}
+
+
+# Upper bound for a session's temp directory before old intermediates are evicted
+TEMP_DIR_MAX_BYTES = 2 * 1024 ** 3
+
+# Number of recordings rendered per page on the Recordings page
+RECORDINGS_PAGE_SIZE = 20
+
+# Recordings listings at least this long read their metadata files on a thread pool
+METADATA_PARALLEL_THRESHOLD = 32
+METADATA_READ_WORKERS = 8
+
+# Choices for the Action column of the recordings table
+RECORDING_ACTIONS = ("🎙️ Transcribe", "📝 Meeting Notes", "✏️ Rename", "🗑️ Delete", "📋 Details")
+
+# Recordings table layout; static, so built once instead of on every rerun
+RECORDINGS_COLUMN_CONFIG = {
+    "select": st.column_config.CheckboxColumn("Select", width="small"),
+    "name": st.column_config.TextColumn("Name"),
+    "date": st.column_config.TextColumn("📅 Date"),
+    "file": st.column_config.TextColumn("📄 File"),
+    "transcribed": st.column_config.CheckboxColumn("Transcribed", width="small"),
+    "action": st.column_config.SelectboxColumn(
+        "Action",
+        options=list(RECORDING_ACTIONS),
+        help="Pick an action to run it on this recording"
+    ),
+}
+RECORDINGS_READONLY_COLUMNS = ("name", "date", "file", "transcribed")
+
+# Audio types accepted by the uploader (matches AudioFileManager.list_recordings)
+UPLOAD_AUDIO_TYPES = ("wav", "mp3", "m4a", "flac", "ogg", "webm")
+
+# Upper bound of the "Parallel requests" sidebar setting for chunk transcription
+MAX_CONCURRENT_REQUESTS = 16
+
+# Transcription jobs allowed to run at once across all sessions; further jobs wait
+MAX_CONCURRENT_JOBS = int(os.environ.get("MAX_CONCURRENT_JOBS", "4"))
+
+# Transcriptions longer than this (in characters) are shown page by page
+TRANSCRIPTION_PAGINATION_THRESHOLD = 100_000
+TRANSCRIPTION_PAGE_SIZE = 20_000
+
+
+@dataclass
+class UIState:
+    """Per-session UI state, kept under a single session_state key.
+
+    Holding everything in one object means the whole graph (including large
+    results and the scratch directory) is released together with the session.
+    """
+    is_recording: bool = False
+    last_recorded_file: Optional[str] = None
+    show_last_recording: bool = False
+
+    # Dialog visibility flags and their arguments
+    show_api_dialog: bool = False
+    show_prompt_dialog: bool = False
+    show_rename_dialog: bool = False
+    show_transcribe_dialog: bool = False
+    show_meeting_notes_dialog: bool = False
+    editing_file: Optional[str] = None
+    current_transcribe_file: Optional[tuple[str, str]] = None
+    current_meeting_notes_file: Optional[tuple[str, str]] = None
+
+    # Results are reset to None (not {}) so the previous dict can be freed
+    transcription_completed: bool = False
+    meeting_notes_completed: bool = False
+    transcription_result: Optional[dict] = None
+    meeting_notes_result: Optional[dict] = None
+    upload_save_job: Optional[dict] = None
+
+    # Per-session scratch space for uploads and intermediate audio, removed when
+    # this state is garbage collected (TemporaryDirectory's finalizer also runs at exit)
+    tmp_dir: tempfile.TemporaryDirectory = field(
+        default_factory=lambda: tempfile.TemporaryDirectory(prefix="ai-meeting-notes-")
+    )
+
+
+@st.cache_resource
+def _get_audio_processor() -> AudioProcessor:
+    """Get the process-wide AudioProcessor (it holds no per-session state)."""
+    return AudioProcessor()
+
+
+@st.cache_resource
+def _transcription_loop() -> asyncio.AbstractEventLoop:
+    """Get the process-wide event loop (running in a daemon thread) for chunk transcription."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="trx-loop", daemon=True).start()
+    return loop
+
+
+@st.cache_resource
+def _transcription_job_slots() -> threading.BoundedSemaphore:
+    """Get the process-wide limiter on concurrently running transcription jobs."""
+    return threading.BoundedSemaphore(max(1, MAX_CONCURRENT_JOBS))
+
+
+def acquire_transcription_slot() -> threading.BoundedSemaphore:
+    """Take a transcription job slot, waiting with a spinner while all are busy.
+
+    Returns the limiter; the caller must release() it when the job ends.
+    """
+    slots = _transcription_job_slots()
+    if slots.acquire(blocking=False):
+        return slots
+
+    acquired = False
+    try:
+        with st.spinner("⏳ Waiting for other transcriptions to finish..."):
+            acquired = slots.acquire()
+    except BaseException:
+        # Leaving the spinner sends UI updates, where Streamlit can raise its
+        # rerun/stop exception; the caller never gets the slot, so give it back
+        if acquired:
+            slots.release()
+        raise
+    return slots
+
+
+@st.cache_resource
+def _get_transcription_cache() -> TranscriptionCache:
+    """Get the shared on-disk transcription cache."""
+    return TranscriptionCache()
+
+
+@st.cache_resource
+def get_openai_client(api_key: str) -> OpenAI:
+    """Get a shared OpenAI client per API key so its HTTP connections survive reruns."""
+    client = create_openai_client(api_key)
+    # Once per key: open the connection before the first transcription needs it
+    warm_up_client(client)
+    return client
+
+
+@st.cache_resource
+def get_async_openai_client(api_key: str) -> AsyncOpenAI:
+    """Get a shared AsyncOpenAI client per API key for use on _transcription_loop() only.
+
+    Chunk batches reuse it, so their keep-alive connections survive between jobs.
+    """
+    return create_async_openai_client(api_key)
+
+
+def is_saved_key(transcription_service: TranscriptionService, config: SecureConfig, api_key: str) -> bool:
+    """Check whether api_key is already the active, saved key, so Save can be skipped."""
+    return fingerprint_api_key(api_key) == transcription_service.key_fingerprint and config.has_api_key()
+
+
+def forget_api_key(transcription_service: TranscriptionService):
+    """Clear the service's API key and evict the shared clients cached for it.
+
+    The cached clients are shared by every session and may be mid-request in another
+    one, so they are only dropped from the cache, not closed.
+    """
+    api_key = transcription_service.api_key
+    transcription_service.clear_api_key()
+    if api_key:
+        get_openai_client.clear(api_key)
+        get_async_openai_client.clear(api_key)
+
+
+def audio_format(filepath: str) -> str:
+    """Get the st.audio format (MIME type) for an audio file from its extension."""
+    return AUDIO_MIME_TYPES.get(os.path.splitext(filepath)[1].lower(), "audio/wav")
+
+
+@st.cache_data(show_spinner=False, ttl=60)
+def _get_microphones(_recorder: AudioRecorder) -> tuple[list[str], int]:
+    """Get (microphone labels, index of the default one), querying the audio devices once.
+
+    Device enumeration goes through PortAudio and would otherwise run on every rerun,
+    including the 0.5 s volume-meter refreshes while recording. The TTL picks up
+    newly plugged-in microphones.
+    """
+    mic_devices = _recorder.get_microphone_devices()
+    default_mic = _recorder.get_default_microphone()
+
+    default_index = 0
+    if default_mic and default_mic in mic_devices:
+        default_index = mic_devices.index(default_mic)
+    return mic_devices, default_index
+
+
+@st.cache_data(show_spinner=False)
+def _get_audio_metadata(filepath: str, mtime_ns: int, size_bytes: int) -> tuple[float, float]:
+    """Get (duration_seconds, file_size_mb) for an audio file, cached until it is modified.
+
+    mtime_ns and size_bytes come from the caller's os.stat() so no extra stat is needed.
+    """
+    file_size_mb = size_bytes / (1024 * 1024)
+    try:
+        duration_seconds = _get_audio_processor().get_audio_duration(filepath)
+    except Exception:
+        duration_seconds = 0
+    return duration_seconds, file_size_mb
+
+
+@dataclass(frozen=True)
+class RecordingsListing:
+    """Snapshot of the recordings directory: rows in display order plus a path index."""
+    # (filename, filepath, formatted_date, display_name, has_transcription)
+    rows: tuple[tuple[str, str, str, str, bool], ...]
+    by_path: dict[str, tuple[str, str, str, str, bool]]
+    # filepath -> "filename (date)", formatted once per listing for selectboxes
+    labels: dict[str, str]
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _list_recordings_cached(
+    _file_manager: AudioFileManager,
+    recordings_dir: str,
+    dir_mtime: int
+) -> RecordingsListing:
+    """
+    List recordings with their display name and transcription status.
+
+    Cached until the recordings directory changes (keyed by its mtime); adding,
+    deleting or re-saving any file in it bumps the directory mtime. Held as a shared
+    resource so reruns get the same read-only snapshot without copying it.
+    """
+    def build_row(recording):
+        filename, filepath, date_str = recording
+        # Read each metadata file once for both the display name and transcription status
+        metadata = _file_manager.load_metadata(filepath)
+        return (
+            filename,
+            filepath,
+            date_str,
+            _file_manager.get_display_name(filepath, metadata),
+            _file_manager.has_transcription(filepath, metadata)
+        )
+
+    recordings = _file_manager.list_recordings()
+    if len(recordings) < METADATA_PARALLEL_THRESHOLD:
+        rows = tuple(map(build_row, recordings))
+    else:
+        # Metadata reads are independent small-file I/O, so overlap them on threads
+        with ThreadPoolExecutor(max_workers=METADATA_READ_WORKERS) as pool:
+            rows = tuple(pool.map(build_row, recordings))
+    return RecordingsListing(
+        rows=rows,
+        by_path={row[1]: row for row in rows},
+        labels={row[1]: f"{row[0]} ({row[2]})" for row in rows}
+    )
+
+
+def get_recordings(file_manager: AudioFileManager) -> RecordingsListing:
+    """Get the cached recordings listing (one stat of the directory when nothing changed)."""
+    recordings_dir = file_manager.recordings_dir
+    return _list_recordings_cached(
+        file_manager, recordings_dir, os.stat(recordings_dir).st_mtime_ns
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _load_transcription_cached(_file_manager: AudioFileManager, filepath: str, mtime: float):
+    """Load a transcription, cached until its metadata file changes (keyed by mtime)."""
+    return _file_manager.load_transcription(filepath)
+
+
+@st.cache_data(show_spinner=False)
+def _load_meeting_notes_cached(_file_manager: AudioFileManager, filepath: str, mtime: float):
+    """Load meeting notes, cached until the metadata file changes (keyed by mtime)."""
+    return _file_manager.load_meeting_notes(filepath)
+
+
+@st.cache_data(show_spinner=False)
+def _get_file_info_cached(_file_manager: AudioFileManager, filepath: str, mtime_ns: int, size_bytes: int) -> str:
+    """Get the file info text, cached until the audio file changes."""
+    return _file_manager.get_file_info(filepath)
+
+
+@st.cache_data(show_spinner=False)
+def _paginate_text(text: str, page_size: int = TRANSCRIPTION_PAGE_SIZE) -> list[str]:
+    """Split text into pages of roughly page_size characters, breaking on sentence boundaries."""
+    pages = []
+    start = 0
+
+    while start < len(text):
+        end = min(start + page_size, len(text))
+        if end < len(text):
+            # Break after the last sentence terminator or newline in the window
+            boundary = max(text.rfind(sep, start, end) for sep in (". ", "? ", "! ", "\n"))
+            if boundary > start:
+                end = boundary + 1
+        pages.append(text[start:end])
+        start = end
+
+    return pages
+
+
+def render_transcription(text: str, key: str):
+    """Render transcription text in a collapsed expander, paginating very long texts."""
+    with st.expander("📄 Show transcription", expanded=False):
+        if len(text) > TRANSCRIPTION_PAGINATION_THRESHOLD:
+            pages = _paginate_text(text)
+            page_index = st.selectbox(
+                "Page",
+                options=range(len(pages)),
+                format_func=lambda i: f"Page {i + 1} of {len(pages)}",
+                key=f"{key}_page"
+            )
+            text = pages[page_index]
+
+        render_copyable_text(text)
+
+
+def render_copyable_text(text: str, height: int = 400):
+    """Show read-only text with a copy button that works entirely in the browser."""
+    # st.code's copy icon copies client-side; a text_area would be a widget that
+    # keeps the whole text in session state and sends it back on every edit
+    st.code(text, language=None, wrap_lines=True, height=height)
+
+
+def copy_with_hash(source, destination, chunk_size: int = 1 << 20) -> str:
+    """Copy a file object in chunks and return the SHA-256 hex digest of its content."""
+    hasher = hashlib.sha256()
+    while chunk := source.read(chunk_size):
+        hasher.update(chunk)
+        destination.write(chunk)
+    return hasher.hexdigest()
+
+
+def save_uploads(uploaded_files, file_manager: AudioFileManager, job: dict):
+    """Save uploaded files to recordings, recording progress and results in job.
+
+    Runs on a worker thread, so it only touches the job dict and never calls st.*.
+    Files are staged in the file manager's incoming directory and renamed into place.
+    """
+    for idx, uploaded_file in enumerate(uploaded_files):
+        job['current'] = uploaded_file.name
+
+        temp_path = None
+        try:
+            # Stream to a temp file in 1 MiB chunks instead of buffering the whole
+            # upload, fingerprinting the content on the way
+            uploaded_file.seek(0)
+            suffix = os.path.splitext(uploaded_file.name)[1]
+            with tempfile.NamedTemporaryFile(suffix=suffix, delete=False, dir=file_manager.incoming_dir) as f:
+                temp_path = f.name
+                content_hash = copy_with_hash(uploaded_file, f)
+
+            # Skip files that were already uploaded
+            existing_path = file_manager.find_duplicate_upload(content_hash)
+            if existing_path:
+                job['duplicate_messages'].append(
+                    f"{uploaded_file.name}: already saved as {os.path.basename(existing_path)}"
+                )
+            else:
+                filepath, message = file_manager.save_uploaded_file(
+                    temp_path, index=idx, content_hash=content_hash, move=True
+                )
+                if filepath:
+                    job['success_count'] += 1
+                else:
+                    job['error_messages'].append(f"{uploaded_file.name}: {message}")
+
+        except Exception as e:
+            job['error_messages'].append(f"{uploaded_file.name}: {str(e)}")
+
+        finally:
+            # Clean up temp file (already gone if it was moved into recordings)
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        job['done'] = idx + 1
+
+
+def release_session_result(key: str):
+    """Drop a (potentially large) UIState result and reclaim its memory."""
+    setattr(st.session_state.ui, key, None)
+    gc.collect(generation=2)
 
 
 def init_session_state(
@@ -22,11 +432,37 @@ def init_session_state(
     if 'file_manager' not in st.session_state:
         st.session_state.file_manager = file_manager
     if 'transcription_service' not in st.session_state:
+        # Read the saved key once per session instead of from disk on every rerun
+        if not transcription_service.is_configured():
+            saved_key = config.load_api_key()
+            if saved_key:
+                transcription_service.set_api_key(saved_key, client_factory=get_openai_client)
         st.session_state.transcription_service = transcription_service
     if 'config' not in st.session_state:
         st.session_state.config = config
-    if 'is_recording' not in st.session_state:
-        st.session_state.is_recording = False
+    if 'ui' not in st.session_state:
+        st.session_state.ui = UIState()
+
+
+def enforce_temp_dir_limit(temp_dir: str, max_bytes: int = TEMP_DIR_MAX_BYTES):
+    """Delete least recently modified files in temp_dir until it is under max_bytes."""
+    files = []
+    with os.scandir(temp_dir) as entries:
+        for entry in entries:
+            if entry.is_file():
+                stat = entry.stat()
+                # mtime, not atime: atime is unreliable on noatime/relatime mounts
+                files.append((stat.st_mtime_ns, stat.st_size, entry.path))
+
+    total_size = sum(size for _, size, _ in files)
+    for _, size, path in sorted(files):
+        if total_size <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total_size -= size
+        except OSError:
+            pass
 
 
 def page_record_and_upload():
@@ -41,12 +477,7 @@ def page_record_and_upload():
         st.markdown("Select your microphone and record audio.")
 
         # Microphone selection
-        mic_devices = recorder.get_microphone_devices()
-        default_mic = recorder.get_default_microphone()
-
-        default_index = 0
-        if default_mic and default_mic in mic_devices:
-            default_index = mic_devices.index(default_mic)
+        mic_devices, default_index = _get_microphones(recorder)
 
         selected_mic = st.selectbox(
             "Select Microphone",
@@ -68,29 +499,29 @@ def page_record_and_upload():
         col1, col2 = st.columns(2)
 
         with col1:
-            if st.button("🔴 Start Recording", disabled=st.session_state.is_recording, use_container_width=True):
+            if st.button("🔴 Start Recording", disabled=st.session_state.ui.is_recording, use_container_width=True):
                 success, message = recorder.start_recording(selected_mic, sample_rate)
                 if success:
-                    st.session_state.is_recording = True
+                    st.session_state.ui.is_recording = True
                     st.success(message)
                     st.rerun()
                 else:
                     st.error(message)
 
         with col2:
-            if st.button("⏹️ Stop Recording", disabled=not st.session_state.is_recording, use_container_width=True):
+            if st.button("⏹️ Stop Recording", disabled=not st.session_state.ui.is_recording, use_container_width=True):
                 audio_file, message = recorder.stop_recording()
-                st.session_state.is_recording = False
+                st.session_state.ui.is_recording = False
                 if audio_file:
                     # Store the completed audio file info for display
-                    st.session_state.last_recorded_file = audio_file
-                    st.session_state.show_last_recording = True
+                    st.session_state.ui.last_recorded_file = audio_file
+                    st.session_state.ui.show_last_recording = True
                     st.success(f"{message}\n\n→ Go to Recordings tab to view your file.")
                 else:
                     st.error(message)
 
         # Volume level indicator when recording
-        if st.session_state.is_recording:
+        if st.session_state.ui.is_recording:
             status_text, status_color = recorder.get_volume_status()
             volume_level = recorder.get_volume_level()
 
@@ -113,31 +544,31 @@ def page_record_and_upload():
             st.progress(volume_percent / 100.0, text=f"Volume: {volume_percent:.0f}%")
 
             # Auto-refresh to update volume level (every 0.5 seconds)
-            import time
             time.sleep(0.5)
             st.rerun()
 
         # Show last recorded audio if available
-        if st.session_state.get('show_last_recording', False) and st.session_state.get('last_recorded_file'):
+        if st.session_state.ui.show_last_recording and st.session_state.ui.last_recorded_file:
             # Check if file still exists
-            if os.path.exists(st.session_state.last_recorded_file):
+            if os.path.exists(st.session_state.ui.last_recorded_file):
                 st.markdown("**Last Recording:**")
                 try:
-                    with open(st.session_state.last_recorded_file, 'rb') as f:
-                        audio_bytes = f.read()
-                        st.audio(audio_bytes, format='audio/wav')
+                    st.audio(
+                        st.session_state.ui.last_recorded_file,
+                        format=audio_format(st.session_state.ui.last_recorded_file)
+                    )
                     if st.button("🗑️ Clear Preview", use_container_width=True):
-                        st.session_state.show_last_recording = False
-                        st.session_state.last_recorded_file = None
+                        st.session_state.ui.show_last_recording = False
+                        st.session_state.ui.last_recorded_file = None
                         st.rerun()
                 except Exception as e:
                     st.warning(f"⚠️ Could not load recording: {str(e)}")
-                    st.session_state.show_last_recording = False
-                    st.session_state.last_recorded_file = None
+                    st.session_state.ui.show_last_recording = False
+                    st.session_state.ui.last_recorded_file = None
             else:
                 # File was deleted, clear the state silently
-                st.session_state.show_last_recording = False
-                st.session_state.last_recorded_file = None
+                st.session_state.ui.show_last_recording = False
+                st.session_state.ui.last_recorded_file = None
 
     # Upload Section
     with st.expander("📤 Upload Audio Files", expanded=True):
@@ -145,60 +576,60 @@ def page_record_and_upload():
 
         uploaded_files = st.file_uploader(
             "Choose audio files",
-            type=['wav', 'mp3', 'm4a', 'flac', 'ogg', 'webm'],
+            type=UPLOAD_AUDIO_TYPES,
             help="Upload audio files to save to recordings",
             accept_multiple_files=True
         )
 
-        if st.button("💾 Save Uploads", disabled=not uploaded_files, use_container_width=True):
-            if uploaded_files:
-                success_count = 0
-                error_count = 0
-                error_messages = []
-
-                # Use a progress bar for multiple files
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-
-                for idx, uploaded_file in enumerate(uploaded_files):
-                    status_text.text(f"Processing {idx + 1}/{len(uploaded_files)}: {uploaded_file.name}")
+        save_job = st.session_state.ui.upload_save_job
+        is_saving = save_job is not None and save_job['thread'].is_alive()
 
-                    try:
-                        # Save to temp file first
-                        temp_path = os.path.join(tempfile.gettempdir(), uploaded_file.name)
-                        with open(temp_path, "wb") as f:
-                            f.write(uploaded_file.getbuffer())
-
-                        filepath, message = file_manager.save_uploaded_file(temp_path, index=idx)
-                        if filepath:
-                            success_count += 1
-                        else:
-                            error_count += 1
-                            error_messages.append(f"{uploaded_file.name}: {message}")
-
-                        # Clean up temp file
-                        try:
-                            os.remove(temp_path)
-                        except:
-                            pass
-
-                    except Exception as e:
-                        error_count += 1
-                        error_messages.append(f"{uploaded_file.name}: {str(e)}")
+        if st.button("💾 Save Uploads", disabled=not uploaded_files or is_saving, use_container_width=True):
+            if uploaded_files:
+                # Save on a worker thread so the script run returns immediately
+                save_job = {
+                    'total': len(uploaded_files),
+                    'done': 0,
+                    'current': None,
+                    'success_count': 0,
+                    'error_messages': [],
+                    'duplicate_messages': [],
+                }
+                thread = threading.Thread(
+                    target=save_uploads,
+                    args=(list(uploaded_files), file_manager, save_job),
+                    daemon=True
+                )
+                add_script_run_ctx(thread)
+                save_job['thread'] = thread
+                st.session_state.ui.upload_save_job = save_job
+                thread.start()
+                is_saving = True
+
+        if save_job is not None:
+            if is_saving:
+                # Poll until the worker finishes
+                st.progress(
+                    save_job['done'] / save_job['total'],
+                    text=f"Processing {min(save_job['done'] + 1, save_job['total'])}/{save_job['total']}: {save_job['current'] or ''}"
+                )
+                time.sleep(0.5)
+                st.rerun()
 
-                    # Update progress
-                    progress_bar.progress((idx + 1) / len(uploaded_files))
+            st.session_state.ui.upload_save_job = None
+            success_count = save_job['success_count']
+            duplicate_messages = save_job['duplicate_messages']
+            error_messages = save_job['error_messages']
 
-                # Clear progress indicators
-                progress_bar.empty()
-                status_text.empty()
+            # Show results
+            if success_count > 0:
+                st.success(f"✓ Successfully uploaded {success_count} file(s)\n\n→ Go to Recordings tab to view your files.")
 
-                # Show results
-                if success_count > 0:
-                    st.success(f"✓ Successfully uploaded {success_count} file(s)\n\n→ Go to Recordings tab to view your files.")
+            if duplicate_messages:
+                st.info(f"ℹ️ Skipped {len(duplicate_messages)} duplicate file(s):\n" + "\n".join(duplicate_messages))
 
-                if error_count > 0:
-                    st.error(f"✗ Failed to upload {error_count} file(s):\n" + "\n".join(error_messages))
+            if error_messages:
+                st.error(f"✗ Failed to upload {len(error_messages)} file(s):\n" + "\n".join(error_messages))
 
 
 @st.dialog("⚙️ API Key Settings", width="large")
@@ -221,12 +652,14 @@ def show_api_key_dialog():
 
     with col1:
         if st.button("💾 Save API Key", use_container_width=True):
-            if api_key_input:
-                success, message = transcription_service.set_api_key(api_key_input)
+            if api_key_input and is_saved_key(transcription_service, config, api_key_input):
+                st.info(f"✓ Key unchanged ({fingerprint_api_key(api_key_input)})")
+            elif api_key_input:
+                success, message = transcription_service.set_api_key(api_key_input, client_factory=get_openai_client)
                 if success:
                     if config.save_api_key(api_key_input):
                         st.success(f"✓ {message}\nAPI key saved securely.")
-                        st.session_state.show_api_dialog = False
+                        st.session_state.ui.show_api_dialog = False
                         st.rerun()
                     else:
                         st.warning(f"✓ {message}\n⚠ Warning: Could not save to file.")
@@ -238,17 +671,16 @@ def show_api_key_dialog():
     with col2:
         if st.button("🗑️ Delete API Key", use_container_width=True):
             if config.delete_api_key():
-                transcription_service.client = None
-                transcription_service.api_key = None
+                forget_api_key(transcription_service)
                 st.success("API key deleted successfully.")
-                st.session_state.show_api_dialog = False
+                st.session_state.ui.show_api_dialog = False
                 st.rerun()
             else:
                 st.error("Failed to delete API key.")
 
     with col3:
         if st.button("✕ Close", use_container_width=True):
-            st.session_state.show_api_dialog = False
+            st.session_state.ui.show_api_dialog = False
             st.rerun()
 
     # Show current status
@@ -299,7 +731,7 @@ def show_prompt_settings_dialog():
             st.rerun()
     with col_mode3:
         if st.button("✕ Close", use_container_width=True):
-            st.session_state.show_prompt_dialog = False
+            st.session_state.ui.show_prompt_dialog = False
             if 'prompt_mode' in st.session_state:
                 del st.session_state.prompt_mode
             if 'selected_prompt_name' in st.session_state:
@@ -469,13 +901,17 @@ def show_rename_dialog(filepath):
 
     with col1:
         if st.button("💾 Save", type="primary", use_container_width=True):
-            if new_name and new_name.strip():
+            if new_name and new_name.strip() == current_display_name:
+                # Nothing changed; skip the metadata write (and recordings cache invalidation)
+                st.session_state.ui.show_rename_dialog = False
+                st.session_state.ui.editing_file = None
+                st.rerun()
+            elif new_name and new_name.strip():
                 success, message = file_manager.set_display_name(filepath, new_name.strip())
                 if success:
                     st.success("✓ Name updated successfully!")
-                    st.session_state.show_rename_dialog = False
-                    if 'editing_file' in st.session_state:
-                        del st.session_state.editing_file
+                    st.session_state.ui.show_rename_dialog = False
+                    st.session_state.ui.editing_file = None
                     st.rerun()
                 else:
                     st.error(f"✗ {message}")
@@ -484,9 +920,8 @@ def show_rename_dialog(filepath):
 
     with col2:
         if st.button("✕ Cancel", use_container_width=True):
-            st.session_state.show_rename_dialog = False
-            if 'editing_file' in st.session_state:
-                del st.session_state.editing_file
+            st.session_state.ui.show_rename_dialog = False
+            st.session_state.ui.editing_file = None
             st.rerun()
 
 
@@ -497,22 +932,25 @@ def show_transcribe_dialog(filepath, filename):
     file_manager = st.session_state.file_manager
 
     # Check if we have a completed transcription result to display
-    if st.session_state.get('transcription_completed', False):
+    if st.session_state.ui.transcription_completed:
         st.markdown(f"**File:** {filename}")
 
         # Display the saved result
-        result = st.session_state.get('transcription_result', {})
+        result = st.session_state.ui.transcription_result or {}
 
         if result.get('success'):
             st.success("✓ Transcription completed successfully.")
 
             st.markdown("### 📄 Transcription Result")
-            st.text_area(
-                "Transcription:",
-                value=result.get('text', ''),
-                height=400,
-                label_visibility="collapsed"
-            )
+            if result.get('save_success'):
+                # Saved transcripts are read back from disk rather than held in session state
+                result_text = _load_transcription_cached(
+                    file_manager, result['filepath'], file_manager.get_metadata_mtime(result['filepath'])
+                )
+            else:
+                st.warning(f"⚠ {result.get('save_message', 'Transcription could not be saved.')}")
+                result_text = result.get('text')
+            render_transcription(result_text or '', key="dialog_transcription_result")
         else:
             st.error(f"❌ Error: {result.get('error', 'Unknown error')}")
             if result.get('traceback'):
@@ -522,11 +960,10 @@ def show_transcribe_dialog(filepath, filename):
         # Done button - clear all state
         if st.button("✓ Done - Return to Recordings", type="primary", use_container_width=True):
             # Clear all transcription-related state
-            st.session_state.transcription_completed = False
-            st.session_state.transcription_result = {}
-            st.session_state.show_transcribe_dialog = False
-            if 'current_transcribe_file' in st.session_state:
-                del st.session_state.current_transcribe_file
+            st.session_state.ui.transcription_completed = False
+            release_session_result('transcription_result')
+            st.session_state.ui.show_transcribe_dialog = False
+            st.session_state.ui.current_transcribe_file = None
             st.rerun()
         return
 
@@ -539,168 +976,145 @@ def show_transcribe_dialog(filepath, filename):
 
         with col1:
             if st.button("⚙️ Open API Key Settings", use_container_width=True):
-                st.session_state.show_api_dialog = True
-                st.session_state.show_transcribe_dialog = False
-                if 'current_transcribe_file' in st.session_state:
-                    del st.session_state.current_transcribe_file
+                st.session_state.ui.show_api_dialog = True
+                st.session_state.ui.show_transcribe_dialog = False
+                st.session_state.ui.current_transcribe_file = None
                 st.rerun()
 
         with col2:
             if st.button("✕ Close", use_container_width=True):
-                st.session_state.show_transcribe_dialog = False
-                if 'current_transcribe_file' in st.session_state:
-                    del st.session_state.current_transcribe_file
+                st.session_state.ui.show_transcribe_dialog = False
+                st.session_state.ui.current_transcribe_file = None
                 st.rerun()
         return
 
-    # Model selection
-    from src.transcription import TRANSCRIPTION_MODELS
-
-    model_options = {f"{info['name']} - {info['price']}": model_id
-                     for model_id, info in TRANSCRIPTION_MODELS.items()}
-
-    selected_model_label = st.selectbox(
-        "Select Model",
-        options=list(model_options.keys()),
-        index=0
-    )
-    selected_model_id = model_options[selected_model_label]
-
-    # Language
-    language = st.text_input(
-        "Language Code (optional)",
-        placeholder="e.g., en, ko, ja",
-        help="Leave empty for auto-detection"
-    )
-
     # Check file size and duration to determine if compression is needed
-    file_size_mb = os.path.getsize(filepath) / (1024 * 1024)
-    audio_processor = AudioProcessor()
-    try:
-        duration_seconds = audio_processor.get_audio_duration(filepath)
-    except:
-        duration_seconds = 0
+    # (cached: decoding the audio for its duration is too slow to repeat on every rerun)
+    stat_result = os.stat(filepath)
+    duration_seconds, file_size_mb = _get_audio_metadata(
+        filepath, stat_result.st_mtime_ns, stat_result.st_size
+    )
+    audio_processor = _get_audio_processor()
 
     # Auto-determine compression need
     # OpenAI API limit: 25MB max file size
     # Chunking threshold: 1400 seconds (23 min 20 sec)
     needs_compression = file_size_mb > 25 or duration_seconds > 1200  # 20 minutes
 
-    # Advanced options
-    with st.expander("⚙️ Advanced Options", expanded=False):
-        st.markdown("**Audio Processing**")
+    # Advanced option defaults, so transcription works without opening the section
+    compress_audio = needs_compression
+    compression_method = _METHOD_LABEL_TO_KEY[_METHOD_LABELS[0]]
+    custom_ffmpeg_options = None
+    chunk_overlap = 30
+    merge_strategy_key = "recommended"
+    enable_timestamps = False
+
+    # An expander still builds its whole body on every rerun, so the advanced
+    # widgets are only created while this toggle is on
+    show_advanced = st.toggle("⚙️ Advanced Options", key="transcribe_show_advanced")
+
+    # Configuration is collected in a form so widget changes don't rerun the dialog;
+    # widgets are therefore rendered unconditionally rather than revealed on change
+    with st.form("transcribe_form", border=False):
+        # Model selection (options are model IDs; labels are display-only)
+        selected_model_id = st.selectbox(
+            "Select Model",
+            options=list(_MODEL_LABELS),
+            format_func=_MODEL_LABELS.__getitem__,
+            index=0
+        )
 
-        # Show file info
-        st.info(f"📊 File size: {file_size_mb:.2f} MB | Duration: {duration_seconds:.1f}s ({duration_seconds/60:.1f} min)")
+        # Language
+        language = st.text_input(
+            "Language Code (optional)",
+            placeholder="e.g., en, ko, ja",
+            help="Leave empty for auto-detection"
+        )
 
-        if needs_compression:
-            st.warning(f"⚠️ Compression recommended: File is {'large (>25MB)' if file_size_mb > 25 else 'long (>20min)'}")
-            compress_audio_default = True
-        else:
-            st.success("✓ File is small and short enough - compression optional")
-            compress_audio_default = False
+        # Advanced options
+        if show_advanced:
+            st.markdown("**Audio Processing**")
 
-        compress_audio = st.checkbox(
-            "Compress audio before transcription",
-            value=compress_audio_default,
-            help="Automatically enabled for large files (>25MB) or long audio (>20min). OpenAI API has 25MB limit."
-        )
+            # Show file info
+            st.info(f"📊 File size: {file_size_mb:.2f} MB | Duration: {duration_seconds:.1f}s ({duration_seconds/60:.1f} min)")
 
-        # Compression method selection
-        compression_method = "recommended"
-        custom_ffmpeg_options = None
+            if needs_compression:
+                st.warning(f"⚠️ Compression recommended: File is {'large (>25MB)' if file_size_mb > 25 else 'long (>20min)'}")
+                compress_audio_default = True
+            else:
+                st.success("✓ File is small and short enough - compression optional")
+                compress_audio_default = False
 
-        if compress_audio:
-            st.markdown("**Compression Method**")
+            compress_audio = st.checkbox(
+                "Compress audio before transcription",
+                value=compress_audio_default,
+                help="Automatically enabled for large files (>25MB) or long audio (>20min). OpenAI API has 25MB limit."
+            )
 
-            method_options = {}
-            for key, info in COMPRESSION_METHODS.items():
-                label = f"{info['name']}"
-                method_options[label] = key
+            # Compression method selection (used only when compression is enabled)
+            st.markdown("**Compression Method**")
 
             selected_method_label = st.radio(
                 "Select compression method:",
-                options=list(method_options.keys()),
+                options=_METHOD_LABELS,
+                captions=_METHOD_CAPTIONS,
                 index=0,
                 help="Choose based on your needs: quality vs speed vs memory usage"
             )
-            compression_method = method_options[selected_method_label]
-
-            # Show detailed info
-            method_info = COMPRESSION_METHODS[compression_method]
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Est. Compression", method_info['estimated_ratio'])
-            with col2:
-                st.metric("Speed", method_info['speed'])
-            with col3:
-                st.metric("Memory", method_info['memory'])
-
-            st.caption(f"ℹ️ {method_info['description']}")
-
-            # Show FFmpeg options
-            st.markdown("**FFmpeg Options**")
-
-            if compression_method == "custom":
-                custom_ffmpeg_options = st.text_input(
-                    "Custom FFmpeg options:",
-                    value=method_info['ffmpeg_options'],
-                    help="Specify your own FFmpeg options"
-                )
-                st.info("💡 The final command will be: `ffmpeg -y -i input.wav [your options] output.opus`")
-            else:
-                st.code(method_info['ffmpeg_options'], language="bash")
-                st.caption("📋 These are the FFmpeg options that will be used.")
+            compression_method = _METHOD_LABEL_TO_KEY[selected_method_label]
 
-        chunk_overlap = st.slider(
-            "Chunk overlap duration (seconds)",
-            min_value=15,
-            max_value=120,
-            value=30,
-            step=15,
-            help="Overlap between chunks for long audio files."
-        )
+            custom_ffmpeg_input = st.text_input(
+                "Custom FFmpeg options (used with the Custom method):",
+                value=COMPRESSION_METHODS['custom']['ffmpeg_options'],
+                help="Specify your own FFmpeg options"
+            )
+            st.caption("💡 The final command will be: `ffmpeg -y -i input.wav [your options] output.opus`")
+            custom_ffmpeg_options = custom_ffmpeg_input if compression_method == "custom" else None
+
+            chunk_overlap = st.slider(
+                "Chunk overlap duration (seconds)",
+                min_value=15,
+                max_value=120,
+                value=30,
+                step=15,
+                help="Overlap between chunks for long audio files."
+            )
 
-        st.markdown("**Chunk Merge Strategy**")
-        merge_strategy = st.radio(
-            "Select merge strategy for long audio:",
-            options=[
-                "Recommended (Smart Overlap Removal)",
-                "Simple (Direct Concatenation)"
-            ],
-            index=0,
-            help="Recommended: Detects and removes duplicate overlapping content. Simple: Concatenates all chunks directly."
-        )
+            st.markdown("**Chunk Merge Strategy**")
+            merge_strategy = st.radio(
+                "Select merge strategy for long audio:",
+                options=[
+                    "Recommended (Smart Overlap Removal)",
+                    "Simple (Direct Concatenation)"
+                ],
+                captions=[
+                    "Detects and removes overlapping content between chunks (80%+ similarity threshold).",
+                    "Concatenates all chunks directly. May duplicate content at chunk boundaries."
+                ],
+                index=0,
+                help="Recommended: Detects and removes duplicate overlapping content. Simple: Concatenates all chunks directly."
+            )
 
-        # Convert display name to strategy key
-        merge_strategy_key = "recommended" if "Recommended" in merge_strategy else "simple"
+            # Convert display name to strategy key
+            merge_strategy_key = "recommended" if "Recommended" in merge_strategy else "simple"
 
-        if merge_strategy_key == "recommended":
-            st.info("💡 **Recommended**: Uses intelligent suffix-prefix matching to detect and remove overlapping content between chunks (80%+ similarity threshold).")
-        else:
-            st.info("💡 **Simple**: Directly concatenates all transcription chunks with spaces. May result in some duplicate content at chunk boundaries.")
+            st.markdown("---")
+            st.markdown("**Transcription Features**")
 
-        st.markdown("---")
-        st.markdown("**Transcription Features**")
+            enable_timestamps = st.checkbox(
+                "Enable timestamps",
+                value=False,
+                help="Add timestamps to transcription (segment-level). Only supported by Whisper-1 model."
+            )
 
-        enable_timestamps = st.checkbox(
-            "Enable timestamps",
-            value=False,
-            help="Add timestamps to transcription (segment-level). Only supported by Whisper-1 model."
+        start_transcription = st.form_submit_button(
+            "🎙️ Start Transcription", type="primary", use_container_width=True
         )
 
-    # Buttons at the bottom
-    col1, col2 = st.columns(2)
-
-    with col1:
-        start_transcription = st.button("🎙️ Start Transcription", type="primary", use_container_width=True)
-
-    with col2:
-        if st.button("✕ Close", use_container_width=True):
-            st.session_state.show_transcribe_dialog = False
-            if 'current_transcribe_file' in st.session_state:
-                del st.session_state.current_transcribe_file
-            st.rerun()
+    if st.button("✕ Close", use_container_width=True):
+        st.session_state.ui.show_transcribe_dialog = False
+        st.session_state.ui.current_transcribe_file = None
+        st.rerun()
 
     # Transcribe button logic
     if start_transcription:
@@ -715,132 +1129,269 @@ def show_transcribe_dialog(filepath, filename):
             response_format = "text"
             timestamp_granularities = None
 
-        try:
-            # Use already computed duration
-            duration = duration_seconds
-            st.info(f"📊 Audio duration: {duration:.1f} seconds ({duration/60:.1f} minutes)")
-
-            needs_chunking = duration > 1400
+        chunk_paths = []
+        temp_dir = st.session_state.ui.tmp_dir.name
+        enforce_temp_dir_limit(temp_dir)
+        job_slots = acquire_transcription_slot()
 
-            processed_file = filepath
-            chunk_paths = []
+        try:
+            # Resolve the compression method's settings once for this run
+            method_info = COMPRESSION_METHODS[compression_method]
+            file_extension = method_info['extension']
+
+            # Identical audio + options transcribed before: reuse the stored result
+            transcription_cache = _get_transcription_cache()
+            cache_key = transcription_cache.make_key(
+                filepath,
+                model=selected_model_id,
+                language=language_code,
+                response_format=response_format,
+                compression=compression_method if compress_audio else None,
+                ffmpeg_options=custom_ffmpeg_options if compress_audio else None,
+                chunk_overlap=chunk_overlap,
+                merge_strategy=merge_strategy_key
+            )
+            transcription_text = transcription_cache.get(cache_key)
 
-            # Step 1: Compression
-            if compress_audio:
-                st.markdown("### 📦 Step 1: Compressing Audio")
-                status_placeholder = st.empty()
+            if transcription_text is not None:
+                st.success("⚡ Loaded from the transcription cache")
+            else:
+                # Chunk errors from a batch; a partial transcript is not cached
+                errors = []
 
-                def compression_progress(message):
-                    status_placeholder.text(message)
+                # Use already computed duration
+                duration = duration_seconds
+                st.info(f"📊 Audio duration: {duration:.1f} seconds ({duration/60:.1f} minutes)")
 
-                method_info = COMPRESSION_METHODS[compression_method]
-                file_extension = method_info['extension']
+                needs_chunking = duration > 1400
 
-                compressed_path = os.path.join(
-                    tempfile.gettempdir(),
-                    f"compressed_{os.path.splitext(os.path.basename(filepath))[0]}{file_extension}"
-                )
+                processed_file = filepath
 
-                success, output_path, message = audio_processor.compress_audio(
-                    filepath,
-                    compressed_path,
-                    method=compression_method,
-                    custom_ffmpeg_options=custom_ffmpeg_options,
-                    progress_callback=compression_progress
-                )
+                # Windows for cutting a file too large for one upload; without a known
+                # duration (or with a single window) it is uploaded whole instead
+                copy_windows = []
+                if stat_result.st_size > MAX_COPY_CHUNK_BYTES and duration > 0:
+                    copy_chunk_duration, copy_overlap = AudioProcessor.get_size_limited_chunking(
+                        duration, stat_result.st_size, overlap_duration=chunk_overlap
+                    )
+                    copy_windows = AudioProcessor.get_chunk_windows(
+                        duration, chunk_duration=copy_chunk_duration, overlap_duration=copy_overlap
+                    )
 
-                if success:
-                    st.success(message)
-                    processed_file = output_path
+                if compress_audio and needs_chunking:
+                    # Pipelined: compress each overlapping window separately and transcribe
+                    # chunks as soon as they are written instead of compress -> split -> transcribe
+                    st.markdown("### 📦 Compressing and Transcribing Chunks")
+                    st.info(f"🔪 Audio is too long ({duration:.0f}s > 1400s). Compressing chunks with {chunk_overlap}-second overlaps and transcribing each as soon as it is ready...")
+
+                    total_chunks = len(AudioProcessor.get_chunk_windows(
+                        duration, chunk_duration=1200, overlap_duration=chunk_overlap
+                    ))
+
+                    chunk_progress = st.progress(0)
+                    chunk_status = st.empty()
+
+                    def chunk_compression_progress(current, total, message):
+                        chunk_status.text(message)
+                        chunk_progress.progress(current / total)
+
+                    def produce_chunks():
+                        # Record produced paths so the finally block can clean them up
+                        for chunk_path in audio_processor.compress_audio_chunks(
+                            filepath,
+                            duration,
+                            method=compression_method,
+                            custom_ffmpeg_options=custom_ffmpeg_options,
+                            chunk_duration=1200,
+                            overlap_duration=chunk_overlap,
+                            progress_callback=chunk_compression_progress,
+                            output_dir=temp_dir
+                        ):
+                            chunk_paths.append(chunk_path)
+                            yield chunk_path
+
+                    chunk_source = produce_chunks()
+                elif compress_audio:
+                    # Short enough for one request: pipe FFmpeg's output straight into the
+                    # upload instead of writing (and re-reading) a compressed temp file
+                    st.markdown("### 📦 Compressing and Transcribing Audio")
+                    chunk_source = None
+                    total_chunks = 1
+                elif needs_chunking:
+                    # Pipelined: transcribe each chunk as soon as it is exported
+                    st.markdown("### ✂️ Splitting and Transcribing Chunks")
+                    st.info(f"🔪 Audio is too long ({duration:.0f}s > 1400s). Splitting into chunks with {chunk_overlap}-second overlaps and transcribing each as soon as it is ready...")
+
+                    total_chunks = len(AudioProcessor.get_chunk_windows(
+                        duration, chunk_duration=1200, overlap_duration=chunk_overlap
+                    ))
+
+                    chunk_progress = st.progress(0)
+                    chunk_status = st.empty()
+
+                    def chunking_progress(current, total, message):
+                        chunk_status.text(message)
+                        chunk_progress.progress(current / total)
+
+                    def produce_chunks():
+                        # Record produced paths so the finally block can clean them up
+                        for chunk_path in audio_processor.iter_audio_chunks(
+                            processed_file,
+                            chunk_duration=1200,
+                            overlap_duration=chunk_overlap,
+                            progress_callback=chunking_progress,
+                            output_dir=temp_dir
+                        ):
+                            chunk_paths.append(chunk_path)
+                            yield chunk_path
+
+                    chunk_source = produce_chunks()
+                elif len(copy_windows) > 1:
+                    # Short but too large for one upload (e.g. uncompressed WAV): cut it
+                    # into stream-copied chunks instead of decoding and re-encoding it
+                    st.markdown("### ✂️ Splitting and Transcribing Chunks")
+
+                    # Cut and merge with the (possibly shrunk) overlap that fits the size limit
+                    chunk_overlap = copy_overlap
+                    total_chunks = len(copy_windows)
+                    st.info(f"🔪 File is too large to upload at once ({file_size_mb:.1f} MB). Cutting it into {total_chunks} chunks with {chunk_overlap}-second overlaps and transcribing each as soon as it is ready...")
+
+                    chunk_progress = st.progress(0)
+                    chunk_status = st.empty()
+
+                    def cutting_progress(current, total, message):
+                        chunk_status.text(message)
+                        chunk_progress.progress(current / total)
+
+                    def produce_chunks():
+                        # Record produced paths so the finally block can clean them up
+                        for chunk_path in audio_processor.copy_audio_chunks(
+                            processed_file,
+                            duration,
+                            copy_chunk_duration,
+                            overlap_duration=chunk_overlap,
+                            progress_callback=cutting_progress,
+                            output_dir=temp_dir
+                        ):
+                            chunk_paths.append(chunk_path)
+                            yield chunk_path
+
+                    chunk_source = produce_chunks()
                 else:
-                    st.error(message)
-                    return
+                    chunk_paths = [processed_file]
+                    chunk_source = chunk_paths
+                    total_chunks = 1
 
-            # Step 2: Chunking
-            if needs_chunking:
-                st.markdown("### ✂️ Step 2: Splitting into Overlapping Chunks")
-                st.info(f"🔪 Audio is too long ({duration:.0f}s > 1400s). Splitting into chunks with {chunk_overlap}-second overlaps...")
+                    st.markdown("### 🎙️ Transcribing Audio")
 
-                chunk_progress = st.progress(0)
-                chunk_status = st.empty()
+                if chunk_source is None:
+                    _, mime_type = STREAM_FORMATS[file_extension]
 
-                def chunking_progress(current, total, message):
-                    chunk_status.text(message)
-                    chunk_progress.progress(current / total)
-
-                chunk_paths = audio_processor.split_audio_with_overlap(
-                    processed_file,
-                    chunk_duration=1200,
-                    overlap_duration=chunk_overlap,
-                    progress_callback=chunking_progress
-                )
-
-                st.success(f"✅ Split into {len(chunk_paths)} chunks")
-            else:
-                chunk_paths = [processed_file]
-
-            # Step 3: Transcription
-            st.markdown("### 🎙️ Step 3: Transcribing Audio")
+                    with st.spinner("Compressing and transcribing (streaming)..."):
+                        process = audio_processor.compress_audio_stream(
+                            filepath,
+                            method=compression_method,
+                            custom_ffmpeg_options=custom_ffmpeg_options
+                        )
+                        try:
+                            transcription_text, status_message = transcription_service.transcribe_stream(
+                                process.stdout,
+                                f"audio{file_extension}",
+                                selected_model_id,
+                                language_code,
+                                timestamp_granularities,
+                                response_format,
+                                mime_type=mime_type
+                            )
+                        finally:
+                            process.stdout.close()
+                            ffmpeg_errors = process.stderr.read().decode(errors="replace")
+                            process.stderr.close()
+                            returncode = process.wait()
+
+                    if transcription_text:
+                        st.success(f"✓ {status_message}")
+                    elif returncode != 0:
+                        st.error(f"✗ FFmpeg error: {ffmpeg_errors[:200] or 'Unknown FFmpeg error'}")
+                    else:
+                        st.error(f"✗ {status_message}")
 
-            if len(chunk_paths) > 1:
-                st.info(f"📝 Processing {len(chunk_paths)} chunks in parallel...")
-
-                trans_progress = st.progress(0)
-                trans_status = st.empty()
-
-                def transcription_progress(current, total, message):
-                    trans_status.text(message)
-                    trans_progress.progress(current / total)
-
-                transcriptions, errors = transcription_service.transcribe_chunks_batch(
-                    chunk_paths,
-                    selected_model_id,
-                    language_code,
-                    timestamp_granularities,
-                    response_format,
-                    progress_callback=transcription_progress
-                )
+                elif total_chunks > 1:
+                    st.info(f"📝 Processing {total_chunks} chunks in parallel...")
 
-                if errors:
-                    st.warning(f"⚠️ Some chunks had errors:\n" + "\n".join(errors))
+                    trans_progress = st.progress(0)
+                    trans_status = st.empty()
 
-                valid_transcriptions = [t for t in transcriptions if t is not None]
+                    def transcription_progress(current, total, message):
+                        trans_status.text(message)
+                        trans_progress.progress(current / total)
 
-                if valid_transcriptions:
-                    transcription_text = audio_processor.merge_transcriptions(
-                        valid_transcriptions,
-                        overlap_duration=chunk_overlap,
-                        strategy=merge_strategy_key
-                    )
-                    st.success(f"✅ Successfully transcribed {len(valid_transcriptions)}/{len(chunk_paths)} chunks")
-                else:
-                    st.error("❌ All chunks failed to transcribe")
-                    transcription_text = None
-
-            else:
-                with st.spinner("Transcribing..."):
-                    transcription_text, status_message = transcription_service.transcribe_audio(
-                        chunk_paths[0],
+                    transcriptions, errors = transcription_service.transcribe_chunks_batch(
+                        chunk_source,
                         selected_model_id,
                         language_code,
                         timestamp_granularities,
-                        response_format
+                        response_format,
+                        progress_callback=transcription_progress,
+                        total_chunks=total_chunks,
+                        loop=_transcription_loop(),
+                        async_client=get_async_openai_client(transcription_service.api_key),
+                        max_concurrent=st.session_state.get('max_concurrent_requests', 8)
                     )
 
-                if transcription_text:
-                    st.success(f"✓ {status_message}")
+                    if errors:
+                        st.warning(f"⚠️ Some chunks had errors:\n" + "\n".join(errors))
+
+                    succeeded = len(transcriptions) - transcriptions.count(None)
+
+                    if succeeded:
+                        # Failed chunks (None) are skipped by merge_transcriptions
+                        transcription_text = audio_processor.merge_transcriptions(
+                            transcriptions,
+                            overlap_duration=chunk_overlap,
+                            strategy=merge_strategy_key
+                        )
+                        st.success(f"✅ Successfully transcribed {succeeded}/{total_chunks} chunks")
+                    else:
+                        st.error("❌ All chunks failed to transcribe")
+                        transcription_text = None
+
+                elif selected_model_id in STREAMING_MODELS and response_format == "text":
+                    # Show the text as the model produces it instead of after the request
+                    try:
+                        with st.container(height=300, border=True):
+                            transcription_text = st.write_stream(
+                                transcription_service.transcribe_audio_streaming(
+                                    chunk_paths[0], selected_model_id, language_code
+                                )
+                            ) or None
+                        status_message = ("Transcription completed successfully." if transcription_text
+                                          else "Transcription returned empty result.")
+                    except Exception as e:
+                        transcription_text, status_message = None, str(e)
+
+                    if transcription_text:
+                        st.success(f"✓ {status_message}")
+                    else:
+                        st.error(f"✗ {status_message}")
+
                 else:
-                    st.error(f"✗ {status_message}")
+                    with st.spinner("Transcribing..."):
+                        transcription_text, status_message = transcription_service.transcribe_audio(
+                            chunk_paths[0],
+                            selected_model_id,
+                            language_code,
+                            timestamp_granularities,
+                            response_format
+                        )
 
-            # Cleanup first
-            if compress_audio and processed_file != filepath:
-                try:
-                    os.remove(processed_file)
-                except:
-                    pass
+                    if transcription_text:
+                        st.success(f"✓ {status_message}")
+                    else:
+                        st.error(f"✗ {status_message}")
 
-            if len(chunk_paths) > 1:
-                audio_processor.cleanup_temp_files(chunk_paths)
+                if transcription_text and not errors:
+                    transcription_cache.put(cache_key, transcription_text)
 
             # Save and store results in session state
             if transcription_text:
@@ -849,35 +1400,44 @@ def show_transcribe_dialog(filepath, filename):
                     transcription_text
                 )
 
-                # Store result in session state and trigger result display
-                st.session_state.transcription_result = {
+                # Store a pointer to the saved result (the text itself is only kept
+                # in session state if saving failed) and trigger result display
+                st.session_state.ui.transcription_result = {
                     'success': True,
-                    'text': transcription_text,
+                    'filepath': filepath,
                     'save_message': save_message,
                     'save_success': save_success
                 }
-                st.session_state.transcription_completed = True
+                if not save_success:
+                    st.session_state.ui.transcription_result['text'] = transcription_text
+                st.session_state.ui.transcription_completed = True
                 st.rerun()
             else:
                 # Transcription failed but no exception
-                st.session_state.transcription_result = {
+                st.session_state.ui.transcription_result = {
                     'success': False,
                     'error': 'Transcription returned empty result'
                 }
-                st.session_state.transcription_completed = True
+                st.session_state.ui.transcription_completed = True
                 st.rerun()
 
         except Exception as e:
-            import traceback
-            # Store error in session state
-            st.session_state.transcription_result = {
+            # Store error in session state (stack trace only in developer mode)
+            st.session_state.ui.transcription_result = {
                 'success': False,
                 'error': str(e),
-                'traceback': traceback.format_exc()
+                'traceback': traceback.format_exc() if st.session_state.get('debug_mode') else None
             }
-            st.session_state.transcription_completed = True
+            st.session_state.ui.transcription_completed = True
             st.rerun()
 
+        finally:
+            job_slots.release()
+            # Always remove intermediates, even on st.rerun()/st.stop() or errors; chunk
+            # generators can fail after writing only one, so filter out the recording
+            # itself rather than relying on the chunk count
+            audio_processor.cleanup_temp_files([path for path in chunk_paths if path != filepath])
+
 
 @st.dialog("📝 Generate AI Meeting Notes", width="large")
 def show_meeting_notes_dialog(filepath, filename):
@@ -888,11 +1448,11 @@ def show_meeting_notes_dialog(filepath, filename):
     from src.meeting_notes import MeetingNotesService, MEETING_NOTES_MODELS
 
     # Check if we have a completed generation result to display
-    if st.session_state.get('meeting_notes_completed', False):
+    if st.session_state.ui.meeting_notes_completed:
         st.markdown(f"**File:** {filename}")
 
         # Display the saved result
-        result = st.session_state.get('meeting_notes_result', {})
+        result = st.session_state.ui.meeting_notes_result or {}
 
         if result.get('success'):
             st.success("✓ AI Meeting Notes generated successfully.")
@@ -922,11 +1482,10 @@ def show_meeting_notes_dialog(filepath, filename):
         # Done button - clear all state
         if st.button("✓ Done - Return to Recordings", type="primary", use_container_width=True):
             # Clear all meeting notes-related state
-            st.session_state.meeting_notes_completed = False
-            st.session_state.meeting_notes_result = {}
-            st.session_state.show_meeting_notes_dialog = False
-            if 'current_meeting_notes_file' in st.session_state:
-                del st.session_state.current_meeting_notes_file
+            st.session_state.ui.meeting_notes_completed = False
+            release_session_result('meeting_notes_result')
+            st.session_state.ui.show_meeting_notes_dialog = False
+            st.session_state.ui.current_meeting_notes_file = None
             st.rerun()
         return
 
@@ -942,42 +1501,42 @@ def show_meeting_notes_dialog(filepath, filename):
 
         with col1:
             if st.button("⚙️ Open API Key Settings", use_container_width=True):
-                st.session_state.show_api_dialog = True
-                st.session_state.show_meeting_notes_dialog = False
-                if 'current_meeting_notes_file' in st.session_state:
-                    del st.session_state.current_meeting_notes_file
+                st.session_state.ui.show_api_dialog = True
+                st.session_state.ui.show_meeting_notes_dialog = False
+                st.session_state.ui.current_meeting_notes_file = None
                 st.rerun()
 
         with col2:
             if st.button("✕ Close", use_container_width=True):
-                st.session_state.show_meeting_notes_dialog = False
-                if 'current_meeting_notes_file' in st.session_state:
-                    del st.session_state.current_meeting_notes_file
+                st.session_state.ui.show_meeting_notes_dialog = False
+                st.session_state.ui.current_meeting_notes_file = None
                 st.rerun()
         return
 
     # Check if transcription exists
-    transcription = file_manager.load_transcription(filepath)
+    transcription = _load_transcription_cached(
+        file_manager, filepath, file_manager.get_metadata_mtime(filepath)
+    )
     if not transcription:
         st.error("❌ No transcription found. Please transcribe the audio first.")
         if st.button("✕ Close", use_container_width=True):
-            st.session_state.show_meeting_notes_dialog = False
-            if 'current_meeting_notes_file' in st.session_state:
-                del st.session_state.current_meeting_notes_file
+            st.session_state.ui.show_meeting_notes_dialog = False
+            st.session_state.ui.current_meeting_notes_file = None
             st.rerun()
         return
 
-    # Model selection
-    model_options = {f"{info['name']} - ${info['pricing']['input']:.2f}/${info['pricing']['output']:.2f} per 1M tokens": model_id
-                     for model_id, info in MEETING_NOTES_MODELS.items()}
+    # Model selection (options are model IDs; labels are display-only)
+    def format_model(model_id):
+        info = MEETING_NOTES_MODELS[model_id]
+        return f"{info['name']} - ${info['pricing']['input']:.2f}/${info['pricing']['output']:.2f} per 1M tokens"
 
-    selected_model_label = st.selectbox(
+    selected_model_id = st.selectbox(
         "Select Model",
-        options=list(model_options.keys()),
+        options=list(MEETING_NOTES_MODELS),
+        format_func=format_model,
         index=0,  # Default to gpt-5
         help="Choose the GPT-5 model for generating meeting notes"
     )
-    selected_model_id = model_options[selected_model_label]
 
     # Language selection
     language_options = {
@@ -1004,7 +1563,7 @@ def show_meeting_notes_dialog(filepath, filename):
         st.markdown("**Prompt Settings**")
 
         # Initialize meeting notes service to get available prompts
-        meeting_notes_service = MeetingNotesService(api_key=api_key)
+        meeting_notes_service = MeetingNotesService(api_key=api_key, client=get_openai_client(api_key))
         available_prompts = meeting_notes_service.get_available_prompts()
 
         prompt_name = st.selectbox(
@@ -1058,9 +1617,8 @@ def show_meeting_notes_dialog(filepath, filename):
 
     with col2:
         if st.button("✕ Close", use_container_width=True):
-            st.session_state.show_meeting_notes_dialog = False
-            if 'current_meeting_notes_file' in st.session_state:
-                del st.session_state.current_meeting_notes_file
+            st.session_state.ui.show_meeting_notes_dialog = False
+            st.session_state.ui.current_meeting_notes_file = None
             st.rerun()
 
     # Generate meeting notes logic
@@ -1068,7 +1626,7 @@ def show_meeting_notes_dialog(filepath, filename):
         try:
             with st.spinner("🤖 Generating AI Meeting Notes..."):
                 # Initialize service
-                meeting_notes_service = MeetingNotesService(api_key=api_key)
+                meeting_notes_service = MeetingNotesService(api_key=api_key, client=get_openai_client(api_key))
 
                 # Generate meeting notes
                 result = meeting_notes_service.generate_meeting_notes(
@@ -1084,12 +1642,12 @@ def show_meeting_notes_dialog(filepath, filename):
 
                 # Check if meeting notes is empty
                 if not meeting_notes_text or not meeting_notes_text.strip():
-                    st.session_state.meeting_notes_result = {
+                    st.session_state.ui.meeting_notes_result = {
                         'success': False,
                         'error': 'API returned empty meeting notes. Please try again.',
                         'debug_info': f"Result keys: {result.keys()}, Usage: {result.get('usage', {})}"
                     }
-                    st.session_state.meeting_notes_completed = True
+                    st.session_state.ui.meeting_notes_completed = True
                     st.rerun()
                     return
 
@@ -1102,36 +1660,179 @@ def show_meeting_notes_dialog(filepath, filename):
                 )
 
                 # Store result in session state
-                st.session_state.meeting_notes_result = {
+                st.session_state.ui.meeting_notes_result = {
                     'success': True,
                     'notes': meeting_notes_text,
                     'usage': result['usage'],
                     'save_message': save_message,
                     'save_success': save_success
                 }
-                st.session_state.meeting_notes_completed = True
+                st.session_state.ui.meeting_notes_completed = True
                 st.rerun()
 
         except Exception as e:
-            import traceback
-            # Store error in session state
-            st.session_state.meeting_notes_result = {
+            # Store error in session state (stack trace only in developer mode)
+            st.session_state.ui.meeting_notes_result = {
                 'success': False,
                 'error': str(e),
-                'traceback': traceback.format_exc()
+                'traceback': traceback.format_exc() if st.session_state.get('debug_mode') else None
             }
-            st.session_state.meeting_notes_completed = True
+            st.session_state.ui.meeting_notes_completed = True
             st.rerun()
 
 
+def _reset_recordings_editor():
+    """Drop pending edits by giving the recordings table a fresh widget key."""
+    st.session_state.recordings_editor_version = st.session_state.get('recordings_editor_version', 0) + 1
+
+
+def _on_recordings_editor_change(editor_key, page_rows):
+    """Sync selections and dispatch the chosen row action from the recordings table."""
+    edited_rows = st.session_state[editor_key]["edited_rows"]
+    action_taken = False
+
+    for row_index, changes in edited_rows.items():
+        filename, filepath, _, _, has_transcription = page_rows[int(row_index)]
+
+        if "select" in changes:
+            if changes["select"]:
+                st.session_state.selected_files_for_deletion.add(filepath)
+            else:
+                st.session_state.selected_files_for_deletion.discard(filepath)
+
+        action = changes.get("action")
+        if not action or action_taken:
+            continue
+        action_taken = True
+
+        if action == "🎙️ Transcribe":
+            st.session_state.ui.current_transcribe_file = (filepath, filename)
+            st.session_state.ui.show_transcribe_dialog = True
+            st.session_state.recordings_open_dialog = True
+        elif action == "📝 Meeting Notes":
+            if has_transcription:
+                st.session_state.ui.current_meeting_notes_file = (filepath, filename)
+                st.session_state.ui.show_meeting_notes_dialog = True
+                st.session_state.recordings_open_dialog = True
+            else:
+                st.toast("⚠ Transcribe this recording before generating meeting notes.")
+        elif action == "✏️ Rename":
+            st.session_state.ui.editing_file = filepath
+            st.session_state.ui.show_rename_dialog = True
+            st.session_state.recordings_open_dialog = True
+        elif action == "🗑️ Delete":
+            success, message = st.session_state.file_manager.delete_recording(filepath)
+            if success:
+                # Clear session state if the deleted file was the last recorded file
+                if st.session_state.ui.last_recorded_file == filepath:
+                    st.session_state.ui.show_last_recording = False
+                    st.session_state.ui.last_recorded_file = None
+                st.session_state.selected_files_for_deletion.discard(filepath)
+                if st.session_state.get('recordings_details_file') == filepath:
+                    st.session_state.recordings_details_file = None
+            st.toast(message)
+        elif action == "📋 Details":
+            st.session_state.recordings_details_file = filepath
+
+    # Rebuild the table from session state so actions stay one-shot and
+    # checkboxes reflect the selection set
+    _reset_recordings_editor()
+
+
+@st.fragment
+def render_recording_details(file_manager, filepath, filename, has_transcription):
+    """Render the audio player and transcription/meeting notes for one recording.
+
+    Runs as a fragment: its buttons rerun only this panel, not the recordings table.
+    """
+    # Display audio player (served from the file path)
+    # Note: Streamlit may show MediaFileStorage errors in logs during rerun, but these are harmless
+    try:
+        audio_loaded_key = f"audio_loaded_{filename}"
+
+        # Only read the audio once the user asks for the player
+        if not st.session_state.get(audio_loaded_key, False):
+            if st.button("▶️ Load Audio Player", key=f"load_audio_{filename}",
+                         use_container_width=True):
+                st.session_state[audio_loaded_key] = True
+                st.rerun(scope="fragment")
+        # Only load audio if file exists and is accessible
+        elif os.path.exists(filepath) and os.path.isfile(filepath):
+            # Pass the path rather than reading the bytes ourselves; Streamlit's media
+            # file manager still loads the file into memory to serve it. st.audio
+            # doesn't infer the format, so pass the one matching the extension
+            st.audio(filepath, format=audio_format(filepath))
+        else:
+            st.warning("⚠️ Audio file not found.")
+    except Exception as e:
+        # Silently ignore Streamlit media storage errors
+        if "MediaFileStorageError" not in str(type(e)):
+            st.warning(f"⚠️ Could not load audio file: {str(e)}")
+
+    # Check what content is available (one stat of the metadata file keys both)
+    metadata_mtime = file_manager.get_metadata_mtime(filepath)
+    transcription = _load_transcription_cached(
+        file_manager, filepath, metadata_mtime
+    ) if has_transcription else None
+    meeting_notes = _load_meeting_notes_cached(file_manager, filepath, metadata_mtime)
+
+    # Show toggle buttons if transcription exists
+    if transcription:
+        # Toggle buttons for switching between Meeting Notes and Transcription
+        view_toggle_key = f"view_toggle_{filename}"
+        if view_toggle_key not in st.session_state:
+            # Default to meeting notes if available, otherwise transcription
+            st.session_state[view_toggle_key] = "meeting_notes" if meeting_notes else "transcription"
+
+        col_a, col_b = st.columns(2)
+        with col_a:
+            if st.button("📝 AI Meeting Notes", key=f"toggle_notes_{filename}",
+                       use_container_width=True,
+                       type="primary" if st.session_state[view_toggle_key] == "meeting_notes" else "secondary"):
+                st.session_state[view_toggle_key] = "meeting_notes"
+                st.rerun(scope="fragment")
+        with col_b:
+            if st.button("📄 Transcription", key=f"toggle_trans_{filename}",
+                       use_container_width=True,
+                       type="primary" if st.session_state[view_toggle_key] == "transcription" else "secondary"):
+                st.session_state[view_toggle_key] = "transcription"
+                st.rerun(scope="fragment")
+
+        st.markdown("---")
+
+        # Display content based on toggle
+        if st.session_state[view_toggle_key] == "meeting_notes":
+            if meeting_notes:
+                # Render meeting notes as markdown in a scrollable container
+                with st.container(height=400, border=True):
+                    st.markdown(meeting_notes)
+
+                # Add "View Full Page" button
+                if st.button("📖 View Full Page", key=f"fullpage_{filename}", use_container_width=True):
+                    st.session_state.meeting_notes_view_file = filepath
+                    st.session_state.current_page = "Meeting Notes View"
+                    st.rerun()
+            else:
+                st.info("*No AI Meeting Notes yet. Pick '📝 Meeting Notes' in the Action column to generate.*")
+        else:  # transcription
+            render_copyable_text(transcription)
+    else:
+        st.markdown("*No transcription available. Pick '🎙️ Transcribe' in the Action column.*")
+
+
+@st.fragment
 def page_recordings():
-    """Unified recordings page with transcription capability."""
+    """Unified recordings page with transcription capability.
+
+    Runs as a fragment, so ticking checkboxes, paging or opening details reruns
+    only this page; actions that open a dialog escalate to a full app rerun.
+    """
     st.header("📂 Audio Recordings")
 
     file_manager = st.session_state.file_manager
 
-    # Get all recordings
-    recordings = file_manager.list_recordings()
+    listing = get_recordings(file_manager)
+    recordings = listing.rows
 
     if not recordings:
         st.info("📭 No recordings found. Record or upload audio in the 'Record & Upload' tab.")
@@ -1167,14 +1868,15 @@ def page_recordings():
                 if success:
                     success_count += 1
                     # Clear session state if the deleted file was the last recorded file
-                    if st.session_state.get('last_recorded_file') == filepath:
-                        st.session_state.show_last_recording = False
-                        st.session_state.last_recorded_file = None
+                    if st.session_state.ui.last_recorded_file == filepath:
+                        st.session_state.ui.show_last_recording = False
+                        st.session_state.ui.last_recorded_file = None
                 else:
                     failed_count += 1
 
             # Clear selection
             st.session_state.selected_files_for_deletion = set()
+            _reset_recordings_editor()
 
             # Show results
             if success_count > 0:
@@ -1189,18 +1891,20 @@ def page_recordings():
     # Select All section with explicit button
     col_select_all1, col_select_all2, col_select_all3 = st.columns([1, 1, 3])
 
-    all_filepaths = [filepath for _, filepath, _ in recordings]
+    all_filepaths = [recording[1] for recording in recordings]
     all_selected = (len(st.session_state.selected_files_for_deletion) == len(recordings) and len(recordings) > 0)
 
     with col_select_all1:
         if st.button("✓ Select All", use_container_width=True, disabled=all_selected):
             st.session_state.selected_files_for_deletion = set(all_filepaths)
-            st.rerun()
+            _reset_recordings_editor()
+            st.rerun(scope="fragment")
 
     with col_select_all2:
         if st.button("✗ Deselect All", use_container_width=True, disabled=len(st.session_state.selected_files_for_deletion) == 0):
             st.session_state.selected_files_for_deletion = set()
-            st.rerun()
+            _reset_recordings_editor()
+            st.rerun(scope="fragment")
 
     with col_select_all3:
         if selected_count > 0:
@@ -1208,183 +1912,69 @@ def page_recordings():
 
     st.markdown("---")
 
-    # Display recordings in a table-like format
-    for filename, filepath, date_str in recordings:
-        # Get display name
-        display_name = file_manager.get_display_name(filepath)
-
-        with st.container():
-            col_checkbox, col1, col2, col3, col3_5, col4, col5 = st.columns([0.3, 2.7, 2, 1, 1, 1, 0.5])
-
-            with col_checkbox:
-                # Checkbox for bulk selection - sync with session state
-                checkbox_key = f"select_{filename}"
-                is_selected = filepath in st.session_state.selected_files_for_deletion
-
-                # Synchronize widget state with selection state
-                # This ensures Select All/Deselect All updates the checkboxes
-                if checkbox_key in st.session_state:
-                    # Widget exists - check if we need to sync from selected_files_for_deletion
-                    widget_state = st.session_state[checkbox_key]
-                    if widget_state != is_selected:
-                        # Mismatch: selection state changed externally (Select All/Deselect All)
-                        # Update widget to match
-                        st.session_state[checkbox_key] = is_selected
-                else:
-                    # First render - initialize widget from selection state
-                    st.session_state[checkbox_key] = is_selected
-
-                # Create unique callback that updates selection based on checkbox state
-                def make_toggle_callback(fp, ck):
-                    def toggle():
-                        # Read the NEW checkbox state (after toggle)
-                        new_checkbox_state = st.session_state[ck]
-                        if new_checkbox_state:
-                            st.session_state.selected_files_for_deletion.add(fp)
-                        else:
-                            st.session_state.selected_files_for_deletion.discard(fp)
-                    return toggle
-
-                st.checkbox(
-                    f"Select {filename}",
-                    key=checkbox_key,
-                    label_visibility="collapsed",
-                    on_change=make_toggle_callback(filepath, checkbox_key)
-                )
-
-            with col1:
-                st.markdown(f"**{display_name}**")
-                st.caption(f"📅 {date_str} | 📄 {filename}")
-
-            with col2:
-                # Check if transcription exists
-                if file_manager.has_transcription(filepath):
-                    st.success("✓ Transcribed")
-                else:
-                    st.warning("⚠ Not transcribed")
-
-            with col3:
-                # Transcribe button
-                if st.button("🎙️", key=f"transcribe_{filename}", use_container_width=True, help="Transcribe"):
-                    st.session_state.current_transcribe_file = (filepath, filename)
-                    st.session_state.show_transcribe_dialog = True
-                    st.rerun()
-
-            with col3_5:
-                # AI Meeting Notes button - only enabled if transcription exists
-                has_transcription = file_manager.has_transcription(filepath)
-                if st.button("📝", key=f"meeting_notes_{filename}", use_container_width=True,
-                           help="Generate AI Meeting Notes", disabled=not has_transcription):
-                    st.session_state.current_meeting_notes_file = (filepath, filename)
-                    st.session_state.show_meeting_notes_dialog = True
-                    st.rerun()
-
-            with col4:
-                # Edit name button
-                if st.button("✏️", key=f"edit_{filename}", use_container_width=True, help="Rename"):
-                    st.session_state.editing_file = filepath
-                    st.session_state.show_rename_dialog = True
-                    st.rerun()
-
-            with col5:
-                # Delete button
-                if st.button("🗑️", key=f"delete_{filename}", use_container_width=True, help="Delete"):
-                    success, message = file_manager.delete_recording(filepath)
-                    if success:
-                        # Clear session state if the deleted file was the last recorded file
-                        if st.session_state.get('last_recorded_file') == filepath:
-                            st.session_state.show_last_recording = False
-                            st.session_state.last_recorded_file = None
-                        st.success(message)
-                        st.rerun()
-                    else:
-                        st.error(message)
-
-            # Expandable details
-            with st.expander(f"📋 Details: {filename}"):
-                # Read and display audio file to avoid Streamlit media storage issues
-                # Note: Streamlit may show MediaFileStorage errors in logs during rerun, but these are harmless
-                try:
-                    # Only load audio if file exists and is accessible
-                    if os.path.exists(filepath) and os.path.isfile(filepath):
-                        # Determine audio format from file extension
-                        file_ext = os.path.splitext(filepath)[1].lower()
-                        format_map = {
-                            '.wav': 'audio/wav',
-                            '.mp3': 'audio/mp3',
-                            '.m4a': 'audio/mp4',
-                            '.flac': 'audio/flac',
-                            '.ogg': 'audio/ogg',
-                            '.webm': 'audio/webm'
-                        }
-                        audio_format = format_map.get(file_ext, 'audio/wav')
-
-                        with open(filepath, 'rb') as audio_file:
-                            audio_bytes = audio_file.read()
-                            # Use a unique key to prevent caching issues
-                            st.audio(audio_bytes, format=audio_format)
-                    else:
-                        st.warning("⚠️ Audio file not found.")
-                except Exception as e:
-                    # Silently ignore Streamlit media storage errors
-                    if "MediaFileStorageError" not in str(type(e)):
-                        st.warning(f"⚠️ Could not load audio file: {str(e)}")
-
-                # Check what content is available
-                transcription = file_manager.load_transcription(filepath)
-                meeting_notes = file_manager.load_meeting_notes(filepath)
-
-                # Show toggle buttons if transcription exists
-                if transcription:
-                    # Toggle buttons for switching between Meeting Notes and Transcription
-                    view_toggle_key = f"view_toggle_{filename}"
-                    if view_toggle_key not in st.session_state:
-                        # Default to meeting notes if available, otherwise transcription
-                        st.session_state[view_toggle_key] = "meeting_notes" if meeting_notes else "transcription"
-
-                    col_a, col_b = st.columns(2)
-                    with col_a:
-                        if st.button("📝 AI Meeting Notes", key=f"toggle_notes_{filename}",
-                                   use_container_width=True,
-                                   type="primary" if st.session_state[view_toggle_key] == "meeting_notes" else "secondary"):
-                            st.session_state[view_toggle_key] = "meeting_notes"
-                            st.rerun()
-                    with col_b:
-                        if st.button("📄 Transcription", key=f"toggle_trans_{filename}",
-                                   use_container_width=True,
-                                   type="primary" if st.session_state[view_toggle_key] == "transcription" else "secondary"):
-                            st.session_state[view_toggle_key] = "transcription"
-                            st.rerun()
-
-                    st.markdown("---")
-
-                    # Display content based on toggle
-                    if st.session_state[view_toggle_key] == "meeting_notes":
-                        if meeting_notes:
-                            # Render meeting notes as markdown in a scrollable container
-                            with st.container(height=400, border=True):
-                                st.markdown(meeting_notes)
+    # Only render one page of rows so the table stays small for large libraries
+    total_pages = math.ceil(len(recordings) / RECORDINGS_PAGE_SIZE)
+    if total_pages > 1:
+        # Clamp a page that no longer exists (e.g. after deletions)
+        if st.session_state.get("recordings_page", 1) > total_pages:
+            st.session_state.recordings_page = total_pages
+        page_number = st.number_input(
+            f"Page (of {total_pages})",
+            min_value=1,
+            max_value=total_pages,
+            value=1,
+            step=1,
+            key="recordings_page"
+        )
+    else:
+        page_number = 1
+
+    page_start = (page_number - 1) * RECORDINGS_PAGE_SIZE
+    page_recordings_slice = recordings[page_start:page_start + RECORDINGS_PAGE_SIZE]
+
+    # One data_editor for the whole page instead of a checkbox and five buttons per row
+    rows = [
+        {
+            "select": filepath in st.session_state.selected_files_for_deletion,
+            "name": display_name,
+            "date": date_str,
+            "file": filename,
+            "transcribed": has_transcription,
+            "action": None,
+        }
+        for filename, filepath, date_str, display_name, has_transcription in page_recordings_slice
+    ]
+    editor_key = f"recordings_editor_{st.session_state.get('recordings_editor_version', 0)}"
+
+    st.data_editor(
+        rows,
+        key=editor_key,
+        column_config=RECORDINGS_COLUMN_CONFIG,
+        disabled=RECORDINGS_READONLY_COLUMNS,
+        num_rows="fixed",
+        hide_index=True,
+        use_container_width=True,
+        on_change=_on_recordings_editor_change,
+        args=(editor_key, page_recordings_slice)
+    )
 
-                            # Add "View Full Page" button
-                            if st.button("📖 View Full Page", key=f"fullpage_{filename}", use_container_width=True):
-                                st.session_state.meeting_notes_view_file = filepath
-                                st.session_state.current_page = "Meeting Notes View"
-                                st.rerun()
-                        else:
-                            st.info("*No AI Meeting Notes yet. Click the '📝' button above to generate.*")
-                    else:  # transcription
-                        # Keep transcription as text area for easier copying
-                        st.text_area(
-                            "Transcription:",
-                            value=transcription,
-                            height=400,
-                            key=f"view_transcription_{filename}",
-                            label_visibility="collapsed"
-                        )
-                else:
-                    st.markdown("*No transcription available. Click 'Transcribe' button above.*")
+    # Dialogs are opened at app level, outside this fragment
+    if st.session_state.pop('recordings_open_dialog', False):
+        st.rerun()
 
-            st.markdown("---")
+    # Details for the recording picked via the "Details" action
+    details = listing.by_path.get(st.session_state.get('recordings_details_file'))
+    if details:
+        filename, filepath, date_str, display_name, has_transcription = details
+        header_col, close_col = st.columns([5, 1])
+        with header_col:
+            st.subheader(f"📋 Details: {display_name}")
+            st.caption(f"📅 {date_str} | 📄 {filename}")
+        with close_col:
+            if st.button("✖ Close", key="close_recording_details", use_container_width=True):
+                st.session_state.recordings_details_file = None
+                st.rerun(scope="fragment")
+        render_recording_details(file_manager, filepath, filename, has_transcription)
 
 
 def page_meeting_notes_view():
@@ -1414,7 +2004,9 @@ def page_meeting_notes_view():
         return
 
     # Load meeting notes
-    meeting_notes = file_manager.load_meeting_notes(filepath)
+    meeting_notes = _load_meeting_notes_cached(
+        file_manager, filepath, file_manager.get_metadata_mtime(filepath)
+    )
 
     if not meeting_notes:
         st.warning("⚠️ No AI Meeting Notes found for this recording.")
@@ -1494,14 +2086,8 @@ def page_meeting_notes_view():
         # Render as markdown
         st.markdown(meeting_notes)
     else:
-        # Display as raw text in a text area
-        st.text_area(
-            "Raw Meeting Notes:",
-            value=meeting_notes,
-            height=600,
-            key=f"raw_text_{filename}",
-            label_visibility="collapsed"
-        )
+        # Display as raw text with a client-side copy button
+        render_copyable_text(meeting_notes, height=600)
 
     st.markdown("---")
 
@@ -1509,8 +2095,8 @@ def page_meeting_notes_view():
     col1, col2, col3 = st.columns([1, 1, 3])
     with col1:
         if st.button("🔄 Regenerate", use_container_width=True, help="Generate new meeting notes"):
-            st.session_state.current_meeting_notes_file = (filepath, filename)
-            st.session_state.show_meeting_notes_dialog = True
+            st.session_state.ui.current_meeting_notes_file = (filepath, filename)
+            st.session_state.ui.show_meeting_notes_dialog = True
             st.rerun()
     with col2:
         if st.button("📄 View Transcription", use_container_width=True):
@@ -1544,8 +2130,10 @@ def page_transcribe():
 
         with col1:
             if st.button("💾 Save API Key", use_container_width=True):
-                if api_key_input:
-                    success, message = transcription_service.set_api_key(api_key_input)
+                if api_key_input and is_saved_key(transcription_service, config, api_key_input):
+                    st.info(f"✓ Key unchanged ({fingerprint_api_key(api_key_input)})")
+                elif api_key_input:
+                    success, message = transcription_service.set_api_key(api_key_input, client_factory=get_openai_client)
                     if success:
                         if config.save_api_key(api_key_input):
                             st.success(f"✓ {message}\nAPI key saved securely.")
@@ -1560,7 +2148,7 @@ def page_transcribe():
             if st.button("📂 Load Saved Key", use_container_width=True):
                 api_key = config.load_api_key()
                 if api_key:
-                    success, message = transcription_service.set_api_key(api_key)
+                    success, message = transcription_service.set_api_key(api_key, client_factory=get_openai_client)
                     if success:
                         st.success("✓ API key loaded successfully.")
                     else:
@@ -1571,8 +2159,7 @@ def page_transcribe():
         with col3:
             if st.button("🗑️ Delete Key", use_container_width=True):
                 if config.delete_api_key():
-                    transcription_service.client = None
-                    transcription_service.api_key = None
+                    forget_api_key(transcription_service)
                     st.success("✓ API key deleted.")
                 else:
                     st.error("✗ Error deleting API key.")
@@ -1585,18 +2172,17 @@ def page_transcribe():
         st.warning("⚠️ Please configure your OpenAI API key first.")
         return
 
-    # File selection
-    recordings = file_manager.list_recordings()
+    # File selection (options are file paths, so the choice survives list changes)
+    labels = get_recordings(file_manager).labels
 
-    if not recordings:
+    if not labels:
         st.info("No recordings found. Record or upload audio first.")
         return
 
-    file_choices = {f"{filename} ({date})": filepath for filename, filepath, date in recordings}
-
-    selected_file_display = st.selectbox(
+    selected_filepath = st.selectbox(
         "Select Audio File",
-        options=list(file_choices.keys()),
+        options=labels,
+        format_func=labels.__getitem__,
         help="Choose a file from your recordings"
     )
 
@@ -1608,19 +2194,15 @@ def page_transcribe():
     - **Whisper-1** ($0.36/hour) - OpenAI's original Whisper model. Reliable and well-tested.
     """)
 
-    model_choices = transcription_service.get_model_choices()
-    model_labels = [choice[0] for choice in model_choices]
-    model_ids = [choice[1] for choice in model_choices]
-
-    selected_model_label = st.selectbox(
+    # Options are model IDs; labels are display-only
+    selected_model_id = st.selectbox(
         "Transcription Model",
-        options=model_labels,
+        options=list(_MODEL_LABELS),
+        format_func=_MODEL_LABELS.__getitem__,
         index=0,
         help="Select the model to use for transcription"
     )
 
-    selected_model_id = model_ids[model_labels.index(selected_model_label)]
-
     # Language option
     language = st.text_input(
         "Language (Optional)",
@@ -1645,19 +2227,13 @@ def page_transcribe():
         if compress_audio:
             st.markdown("**Compression Method**")
 
-            # Create options with descriptions
-            method_options = {}
-            for key, info in COMPRESSION_METHODS.items():
-                label = f"{info['name']}"
-                method_options[label] = key
-
             selected_method_label = st.radio(
                 "Select compression method:",
-                options=list(method_options.keys()),
+                options=_METHOD_LABELS,
                 index=0,  # Default to first option (recommended)
                 help="Choose based on your needs: quality vs speed vs memory usage"
             )
-            compression_method = method_options[selected_method_label]
+            compression_method = _METHOD_LABEL_TO_KEY[selected_method_label]
 
             # Show detailed info about selected method
             method_info = COMPRESSION_METHODS[compression_method]
@@ -1740,11 +2316,10 @@ def page_transcribe():
 
     # Transcribe button
     if st.button("🎙️ Transcribe Audio", type="primary", use_container_width=True):
-        selected_filepath = file_choices[selected_file_display]
         language_code = language.strip() if language and language.strip() else None
 
         # Initialize audio processor
-        audio_processor = AudioProcessor()
+        audio_processor = _get_audio_processor()
 
         # Determine transcription format based on timestamp option
         if enable_timestamps:
@@ -1754,7 +2329,17 @@ def page_transcribe():
             response_format = "text"
             timestamp_granularities = None
 
+        compressed_path = None
+        chunk_paths = []
+        temp_dir = st.session_state.ui.tmp_dir.name
+        enforce_temp_dir_limit(temp_dir)
+        job_slots = acquire_transcription_slot()
+
         try:
+            # Resolve the compression method's settings once for this run
+            method_info = COMPRESSION_METHODS[compression_method]
+            file_extension = method_info['extension']
+
             # Check audio duration
             duration = audio_processor.get_audio_duration(selected_filepath)
             st.info(f"📊 Audio duration: {duration:.1f} seconds ({duration/60:.1f} minutes)")
@@ -1764,108 +2349,98 @@ def page_transcribe():
 
             # Process audio
             processed_file = selected_filepath
-            chunk_paths = []
 
-            # Step 1: Compression (if enabled)
-            if compress_audio:
-                st.markdown("### 📦 Step 1: Compressing Audio")
-                progress_placeholder = st.empty()
-                status_placeholder = st.empty()
+            # All steps report into a single status container updated in place
+            with st.status("Processing audio...", expanded=True) as status:
+                # Step 1: Compression (if enabled)
+                if compress_audio:
+                    status.update(label="📦 Step 1: Compressing audio...")
+
+                    def compression_progress(message):
+                        status.update(label=f"📦 {message}")
+
+                    # Unique per run so concurrent sessions never collide
+                    with tempfile.NamedTemporaryFile(prefix="compressed_", suffix=file_extension,
+                                                     delete=False, dir=temp_dir) as tf:
+                        compressed_path = tf.name
+
+                    success, output_path, message = audio_processor.compress_audio(
+                        selected_filepath,
+                        compressed_path,
+                        method=compression_method,
+                        custom_ffmpeg_options=custom_ffmpeg_options,
+                        progress_callback=compression_progress
+                    )
 
-                def compression_progress(message):
-                    status_placeholder.text(message)
+                    if success:
+                        status.write(f"✅ {message}")
+                        processed_file = output_path
+                    else:
+                        status.update(label="Compression failed", state="error")
+                        st.error(message)
+                        st.stop()
 
-                # Get file extension based on compression method
-                method_info = COMPRESSION_METHODS[compression_method]
-                file_extension = method_info['extension']
+                # Step 2: Chunking (if needed)
+                if needs_chunking:
+                    status.update(label="✂️ Step 2: Splitting into overlapping chunks...")
+                    status.write(f"🔪 Audio is too long ({duration:.0f}s > 1400s). Splitting into chunks with {chunk_overlap}-second overlaps...")
 
-                compressed_path = os.path.join(
-                    tempfile.gettempdir(),
-                    f"compressed_{os.path.splitext(os.path.basename(selected_filepath))[0]}{file_extension}"
-                )
+                    def chunking_progress(current, total, message):
+                        status.update(label=f"✂️ {message}")
 
-                success, output_path, message = audio_processor.compress_audio(
-                    selected_filepath,
-                    compressed_path,
-                    method=compression_method,
-                    custom_ffmpeg_options=custom_ffmpeg_options,
-                    progress_callback=compression_progress
-                )
+                    chunk_paths = audio_processor.split_audio_with_overlap(
+                        processed_file,
+                        chunk_duration=1200,  # 20 minutes
+                        overlap_duration=chunk_overlap,
+                        progress_callback=chunking_progress,
+                        output_dir=temp_dir
+                    )
 
-                if success:
-                    st.success(message)
-                    processed_file = output_path
+                    status.write(f"✅ Split into {len(chunk_paths)} chunks")
                 else:
-                    st.error(message)
-                    st.stop()
+                    chunk_paths = [processed_file]
 
-            # Step 2: Chunking (if needed)
-            if needs_chunking:
-                st.markdown("### ✂️ Step 2: Splitting into Overlapping Chunks")
-                st.info(f"🔪 Audio is too long ({duration:.0f}s > 1400s). Splitting into chunks with {chunk_overlap}-second overlaps...")
+                # Step 3: Transcription
+                status.update(label="🎙️ Step 3: Transcribing audio...")
 
-                chunk_progress = st.progress(0)
-                chunk_status = st.empty()
+                if len(chunk_paths) > 1:
+                    status.write(f"📝 Processing {len(chunk_paths)} chunks in parallel...")
 
-                def chunking_progress(current, total, message):
-                    chunk_status.text(message)
-                    chunk_progress.progress(current / total)
+                    def transcription_progress(current, total, message):
+                        status.update(label=f"🎙️ {message}")
 
-                chunk_paths = audio_processor.split_audio_with_overlap(
-                    processed_file,
-                    chunk_duration=1200,  # 20 minutes
-                    overlap_duration=chunk_overlap,
-                    progress_callback=chunking_progress
-                )
-
-                st.success(f"✅ Split into {len(chunk_paths)} chunks")
-            else:
-                chunk_paths = [processed_file]
+                    # Batch transcription
+                    transcriptions, errors = transcription_service.transcribe_chunks_batch(
+                        chunk_paths,
+                        selected_model_id,
+                        language_code,
+                        timestamp_granularities,
+                        response_format,
+                        progress_callback=transcription_progress,
+                        loop=_transcription_loop(),
+                        async_client=get_async_openai_client(transcription_service.api_key),
+                        max_concurrent=st.session_state.get('max_concurrent_requests', 8)
+                    )
 
-            # Step 3: Transcription
-            st.markdown("### 🎙️ Step 3: Transcribing Audio")
+                    if errors:
+                        status.write(f"⚠️ Some chunks had errors:\n" + "\n".join(errors))
 
-            if len(chunk_paths) > 1:
-                st.info(f"📝 Processing {len(chunk_paths)} chunks in parallel...")
-
-                trans_progress = st.progress(0)
-                trans_status = st.empty()
-
-                def transcription_progress(current, total, message):
-                    trans_status.text(message)
-                    trans_progress.progress(current / total)
-
-                # Batch transcription
-                transcriptions, errors = transcription_service.transcribe_chunks_batch(
-                    chunk_paths,
-                    selected_model_id,
-                    language_code,
-                    timestamp_granularities,
-                    response_format,
-                    progress_callback=transcription_progress
-                )
+                    succeeded = len(transcriptions) - transcriptions.count(None)
 
-                if errors:
-                    st.warning(f"⚠️ Some chunks had errors:\n" + "\n".join(errors))
-
-                # Filter out None values
-                valid_transcriptions = [t for t in transcriptions if t is not None]
+                    if succeeded:
+                        # Merge transcriptions (failed chunks are skipped)
+                        transcription_text = audio_processor.merge_transcriptions(
+                            transcriptions,
+                            overlap_duration=chunk_overlap,
+                            strategy=merge_strategy_key
+                        )
+                        status.write(f"✅ Successfully transcribed {succeeded}/{len(chunk_paths)} chunks")
+                    else:
+                        status.write("❌ All chunks failed to transcribe")
+                        transcription_text = None
 
-                if valid_transcriptions:
-                    # Merge transcriptions
-                    transcription_text = audio_processor.merge_transcriptions(
-                        valid_transcriptions,
-                        overlap_duration=chunk_overlap,
-                        strategy=merge_strategy_key
-                    )
-                    st.success(f"✅ Successfully transcribed {len(valid_transcriptions)}/{len(chunk_paths)} chunks")
                 else:
-                    st.error("❌ All chunks failed to transcribe")
-                    transcription_text = None
-
-            else:
-                # Single file transcription
-                with st.spinner("Transcribing..."):
+                    # Single file transcription
                     transcription_text, status_message = transcription_service.transcribe_audio(
                         chunk_paths[0],
                         selected_model_id,
@@ -1873,11 +2448,12 @@ def page_transcribe():
                         timestamp_granularities,
                         response_format
                     )
+                    status.write(f"✓ {status_message}" if transcription_text else f"✗ {status_message}")
 
                 if transcription_text:
-                    st.success(f"✓ {status_message}")
+                    status.update(label="Done", state="complete", expanded=False)
                 else:
-                    st.error(f"✗ {status_message}")
+                    status.update(label="Transcription failed", state="error")
 
             # Save and display results
             if transcription_text:
@@ -1893,75 +2469,71 @@ def page_transcribe():
                     st.warning(f"⚠ {save_message}")
 
                 st.markdown("### 📄 Transcription Result")
-                st.text_area(
-                    "Transcription:",
-                    value=transcription_text,
-                    height=400,
-                    label_visibility="collapsed"
-                )
-
-            # Cleanup
-            if compress_audio and processed_file != selected_filepath:
-                try:
-                    os.remove(processed_file)
-                except:
-                    pass
-
-            if len(chunk_paths) > 1:
-                audio_processor.cleanup_temp_files(chunk_paths)
+                render_transcription(transcription_text, key="page_transcription_result")
 
         except Exception as e:
             st.error(f"❌ Error: {str(e)}")
-            import traceback
-            st.code(traceback.format_exc())
+            if st.session_state.get('debug_mode'):
+                st.code(traceback.format_exc())
+
+        finally:
+            job_slots.release()
+            # Always remove intermediates, even on st.stop() or errors
+            temp_files = [compressed_path] if compressed_path else []
+            if len(chunk_paths) > 1:
+                temp_files.extend(chunk_paths)
+            audio_processor.cleanup_temp_files(temp_files)
 
 
 def page_browse_recordings():
     """Browse Recordings page."""
     st.header("📂 Browse and Manage Audio Files")
 
-    file_manager = st.session_state.file_manager
+    ss = st.session_state
+    file_manager = ss.file_manager
 
     # Refresh button
     if st.button("🔄 Refresh List", use_container_width=True):
         st.rerun()
 
-    recordings = file_manager.list_recordings()
+    listing = get_recordings(file_manager)
+    recordings = listing.by_path
 
     if not recordings:
         st.info("No recordings found. Record or upload audio first.")
         return
 
-    # File selection
-    file_choices = {f"{filename} ({date})": (filepath, filename) for filename, filepath, date in recordings}
-
-    selected_file_display = st.selectbox(
+    # File selection (options are file paths; labels are preformatted by the listing)
+    filepath = st.selectbox(
         "Select Recording",
-        options=list(file_choices.keys()),
+        options=listing.labels,
+        format_func=listing.labels.__getitem__,
         help="Select a file to view details and play"
     )
 
-    if selected_file_display:
-        filepath, filename = file_choices[selected_file_display]
+    if filepath is not None:
+        filename = recordings[filepath][0]
 
-        # File information
-        file_info = file_manager.get_file_info(filepath)
+        # File information (keyed by a single stat of the audio file)
+        try:
+            stat_result = os.stat(filepath)
+            file_info = _get_file_info_cached(
+                file_manager, filepath, stat_result.st_mtime_ns, stat_result.st_size
+            )
+        except OSError:
+            file_info = "File not found."
         st.info(file_info)
 
         # Audio player
-        st.audio(filepath)
+        st.audio(filepath, format=audio_format(filepath))
 
         # Transcription display
-        transcription = file_manager.load_transcription(filepath)
+        transcription = _load_transcription_cached(
+            file_manager, filepath, file_manager.get_metadata_mtime(filepath)
+        )
         if transcription:
             st.markdown("**Transcription:**")
-            st.text_area(
-                "Transcription:",
-                value=transcription,
-                height=400,
-                key=f"browse_transcription_{filename}",
-                label_visibility="collapsed"
-            )
+            render_transcription(transcription, key=f"browse_transcription_{filename}")
         else:
             st.markdown("*No transcription available for this file.*")
 
@@ -1976,6 +2548,37 @@ def page_browse_recordings():
                 st.error(message)
 
 
+# Dialogs in priority order: (visibility flag, dialog function, session key holding its
+# arguments or None). Streamlit allows only one open dialog per run.
+_DIALOGS = [
+    ('show_api_dialog', show_api_key_dialog, None),
+    ('show_prompt_dialog', show_prompt_settings_dialog, None),
+    ('show_rename_dialog', show_rename_dialog, 'editing_file'),
+    ('show_transcribe_dialog', show_transcribe_dialog, 'current_transcribe_file'),
+    ('show_meeting_notes_dialog', show_meeting_notes_dialog, 'current_meeting_notes_file'),
+]
+
+
+def show_active_dialog():
+    """Open the first dialog whose visibility flag is set."""
+    ui = st.session_state.ui
+    for flag, dialog, args_key in _DIALOGS:
+        if not getattr(ui, flag):
+            continue
+
+        if args_key is None:
+            dialog()
+            return
+
+        args = getattr(ui, args_key)
+        if args is not None:
+            if isinstance(args, tuple):
+                dialog(*args)
+            else:
+                dialog(args)
+            return
+
+
 def create_streamlit_app(
     recorder: AudioRecorder,
     file_manager: AudioFileManager,
@@ -2011,21 +2614,45 @@ def create_streamlit_app(
     # Initialize session state
     init_session_state(recorder, file_manager, transcription_service, config)
 
+    # Bind once: every st.session_state access goes through Streamlit's proxy
+    ss = st.session_state
+    ui = ss.ui
+
     # Sidebar navigation
     st.sidebar.title("🎙️ AI Meeting Notes")
     st.sidebar.markdown("Record or upload audio to transcribe your meetings.")
 
     # Settings buttons in sidebar
     if st.sidebar.button("⚙️ API Key Settings", use_container_width=True):
-        st.session_state.show_api_dialog = True
+        ui.show_api_dialog = True
 
     if st.sidebar.button("📝 Prompt Settings", use_container_width=True):
-        st.session_state.show_prompt_dialog = True
+        ui.show_prompt_dialog = True
+
+    st.sidebar.slider(
+        "⚡ Parallel requests",
+        min_value=1,
+        max_value=MAX_CONCURRENT_REQUESTS,
+        value=8,
+        key="max_concurrent_requests",
+        help="How many audio chunks are transcribed at once. Lower this if you hit OpenAI rate limits."
+    )
+
+    if st.sidebar.button("🧹 Clear Transcription Cache", use_container_width=True,
+                         help="Forget stored results so the same audio is sent to OpenAI again"):
+        _, message = _get_transcription_cache().clear()
+        st.toast(message)
+
+    st.sidebar.checkbox(
+        "🛠️ Developer mode",
+        key="debug_mode",
+        help="Show full stack traces when an error occurs"
+    )
 
     st.sidebar.markdown("---")
 
     # Check if we're viewing meeting notes full page (overrides navigation)
-    if st.session_state.get('current_page') == "Meeting Notes View":
+    if ss.get('current_page') == "Meeting Notes View":
         page_meeting_notes_view()
         # Don't show dialogs on full page view
         return
@@ -2037,13 +2664,13 @@ def create_streamlit_app(
     )
 
     # Clear recording preview when switching pages
-    if 'current_page' not in st.session_state:
-        st.session_state.current_page = page
-    elif st.session_state.current_page != page:
+    if 'current_page' not in ss:
+        ss.current_page = page
+    elif ss.current_page != page:
         # Page changed, clear preview
-        st.session_state.show_last_recording = False
-        st.session_state.last_recorded_file = None
-        st.session_state.current_page = page
+        ui.show_last_recording = False
+        ui.last_recorded_file = None
+        ss.current_page = page
 
     # Route to appropriate page
     if page == "Record & Upload":
@@ -2051,24 +2678,5 @@ def create_streamlit_app(
     elif page == "Recordings":
         page_recordings()
 
-    # Show dialogs if triggered (must be after page rendering)
-    if st.session_state.get('show_api_dialog', False):
-        show_api_key_dialog()
-
-    if st.session_state.get('show_prompt_dialog', False):
-        show_prompt_settings_dialog()
-
-    if st.session_state.get('show_rename_dialog', False):
-        if 'editing_file' in st.session_state:
-            filepath = st.session_state.editing_file
-            show_rename_dialog(filepath)
-
-    if st.session_state.get('show_transcribe_dialog', False):
-        if 'current_transcribe_file' in st.session_state:
-            filepath, filename = st.session_state.current_transcribe_file
-            show_transcribe_dialog(filepath, filename)
-
-    if st.session_state.get('show_meeting_notes_dialog', False):
-        if 'current_meeting_notes_file' in st.session_state:
-            filepath, filename = st.session_state.current_meeting_notes_file
-            show_meeting_notes_dialog(filepath, filename)
+    # Show dialog if triggered (must be after page rendering)
+    show_active_dialog()
@@ -1,10 +1,20 @@
 """Audio transcription functionality using OpenAI API."""
 
-from openai import OpenAI
-from typing import Optional, Tuple, List, Callable
+import httpx
+from openai import (
+    APITimeoutError, AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI, RateLimitError
+)
+from typing import (
+    Optional, Tuple, List, Callable, Awaitable, Iterable, Iterator, BinaryIO, TextIO, TypeVar, Union
+)
+import io
 import os
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import random
+import threading
+import time
+from concurrent.futures import as_completed
 
 
 # Model information
@@ -14,24 +24,103 @@ TRANSCRIPTION_MODELS = {
         "description": "Fast and cost-effective transcription model. Best for general use cases.",
         "price": "$0.18/hour",
         "default": True,
-        "supports_verbose_json": False  # Only supports 'text' and 'json'
+        "supports_verbose_json": False,  # Only supports 'text' and 'json'
+        "supports_streaming": True  # Can stream text deltas (stream=True)
     },
     "gpt-4o-transcribe": {
         "name": "GPT-4o Transcribe",
         "description": "High-quality transcription with better accuracy. Ideal for complex audio.",
         "price": "$0.36/hour",
         "default": False,
-        "supports_verbose_json": False  # Only supports 'text' and 'json'
+        "supports_verbose_json": False,  # Only supports 'text' and 'json'
+        "supports_streaming": True  # Can stream text deltas (stream=True)
     },
     "whisper-1": {
         "name": "Whisper-1",
         "description": "OpenAI's original Whisper model. Reliable and well-tested.",
         "price": "$0.36/hour",
         "default": False,
-        "supports_verbose_json": True  # Supports 'verbose_json' with timestamps
+        "supports_verbose_json": True,  # Supports 'verbose_json' with timestamps
+        "supports_streaming": False
     }
 }
 
+# OpenAI's upload limit for transcription requests
+MAX_UPLOAD_BYTES = 25 * 1024 * 1024
+
+# Content types sent with file uploads, by extension
+AUDIO_MIME_TYPES = {
+    ".opus": "audio/ogg",
+    ".ogg": "audio/ogg",
+    ".mp3": "audio/mpeg",
+    ".m4a": "audio/mp4",
+    ".wav": "audio/wav",
+    ".flac": "audio/flac",
+    ".webm": "audio/webm",
+}
+
+# Retries for transient API errors (random exponential backoff, 5 attempts in total).
+# Transcription requests turn the SDK's own retries off so this is the only policy.
+RETRYABLE_ERRORS = (RateLimitError, APITimeoutError)
+MAX_RETRIES = 4
+RETRY_MIN_DELAY = 1.0  # seconds
+RETRY_MAX_DELAY = 30.0  # seconds
+T = TypeVar("T")  # result of a retried request
+
+# Models that accept response_format="verbose_json"
+VERBOSE_JSON_MODELS = frozenset(
+    model_id for model_id, info in TRANSCRIPTION_MODELS.items()
+    if info.get("supports_verbose_json")
+)
+
+# Models that can stream plain-text transcripts as they are produced
+STREAMING_MODELS = frozenset(
+    model_id for model_id, info in TRANSCRIPTION_MODELS.items()
+    if info.get("supports_streaming")
+)
+
+# (label, model_id) pairs for the model dropdown, built once at import
+MODEL_CHOICES = tuple(
+    (f"{info['name']} - {info['price']}" + (" (Default)" if info.get('default') else ""), model_id)
+    for model_id, info in TRANSCRIPTION_MODELS.items()
+)
+
+# HTTP connection pool for the OpenAI client, sized so parallel chunk uploads
+# reuse keep-alive connections instead of reconnecting (and re-doing TLS)
+HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+HTTP_TIMEOUT = httpx.Timeout(600.0, connect=10.0)
+
+
+def create_openai_client(api_key: str) -> OpenAI:
+    """Create an OpenAI client with a connection pool tuned for parallel uploads."""
+    http_client = DefaultHttpxClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+    return OpenAI(api_key=api_key, http_client=http_client)
+
+
+def create_async_openai_client(api_key: str) -> AsyncOpenAI:
+    """Create an AsyncOpenAI client with the same connection pool settings."""
+    http_client = DefaultAsyncHttpxClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+    return AsyncOpenAI(api_key=api_key, http_client=http_client)
+
+
+def fingerprint_api_key(api_key: str) -> str:
+    """Short, deterministic fingerprint of an API key, safe to display or compare."""
+    return hashlib.sha256(api_key.strip().encode()).hexdigest()[:8]
+
+
+def warm_up_client(client: OpenAI) -> None:
+    """Open a pooled connection (TCP + TLS) in the background with a cheap request.
+
+    Failures are ignored; the first real request simply pays the handshake instead.
+    """
+    def _warm_up():
+        try:
+            client.models.list()
+        except Exception:
+            pass
+
+    threading.Thread(target=_warm_up, name="openai-warmup", daemon=True).start()
+
 
 class TranscriptionService:
     """Handle audio transcription using OpenAI API."""
@@ -39,11 +128,29 @@ class TranscriptionService:
     def __init__(self):
         self.client: Optional[OpenAI] = None
         self.api_key: Optional[str] = None
+        self._owns_client = False
+        self._key_fp: Optional[str] = None
 
-    def set_api_key(self, api_key: str) -> Tuple[bool, str]:
+    @property
+    def key_fingerprint(self) -> Optional[str]:
+        """Fingerprint of the active API key, or None when no key is set."""
+        return self._key_fp
+
+    def set_api_key(
+        self,
+        api_key: str,
+        client_factory: Callable[[str], OpenAI] = create_openai_client
+    ) -> Tuple[bool, str]:
         """
         Set and validate the OpenAI API key.
 
+        Args:
+            api_key: OpenAI API key
+            client_factory: Callable that builds a client from the key; pass a cached
+                factory to reuse one client (and its connection pool) across calls.
+                Clients from the default factory are closed when replaced, and are
+                warmed up in the background (a cached factory should warm its own)
+
         Returns:
             Tuple of (success: bool, message: str)
         """
@@ -59,16 +166,34 @@ class TranscriptionService:
                 return False, "Invalid API key format. OpenAI API keys should start with 'sk-'."
 
             # Try to create client and validate
-            self.client = OpenAI(api_key=api_key)
+            client = client_factory(api_key=api_key)
+            if self._owns_client and self.client is not None and self.client is not client:
+                self.client.close()
+            self.client = client
+            self._owns_client = client_factory is create_openai_client
             self.api_key = api_key
 
+            self._key_fp = fingerprint_api_key(api_key)
+            if self._owns_client:
+                warm_up_client(client)
+
             return True, "API key set successfully."
 
         except Exception as e:
             self.client = None
             self.api_key = None
+            self._key_fp = None
             return False, f"Error setting API key: {str(e)}"
 
+    def clear_api_key(self):
+        """Forget the current API key, closing an owned client."""
+        if self._owns_client and self.client is not None:
+            self.client.close()
+        self.client = None
+        self.api_key = None
+        self._owns_client = False
+        self._key_fp = None
+
     def is_configured(self) -> bool:
         """Check if the service is properly configured with an API key."""
         return self.client is not None and self.api_key is not None
@@ -96,23 +221,23 @@ class TranscriptionService:
             output_lines.append("=" * 80 + "\n")
 
         # Add segments with timestamps
-        if hasattr(transcript, 'segments'):
-            for segment in transcript.segments:
-                # Handle both dict and object attributes
-                if isinstance(segment, dict):
-                    start = segment.get('start', 0)
-                    end = segment.get('end', 0)
-                    text = segment.get('text', '')
-                else:
-                    start = getattr(segment, 'start', 0)
-                    end = getattr(segment, 'end', 0)
-                    text = getattr(segment, 'text', '')
-
-                # Format timestamp
-                start_time = self._format_timestamp(start)
-                end_time = self._format_timestamp(end)
-
-                output_lines.append(f"[{start_time} -> {end_time}] {text}")
+        segments = getattr(transcript, 'segments', None)
+        if segments:
+            # Segments are homogeneous (all dicts or all objects), so pick the
+            # field accessor once instead of branching per segment
+            if isinstance(segments[0], dict):
+                def fields(segment):
+                    return segment.get('start', 0), segment.get('end', 0), segment.get('text', '')
+            else:
+                def fields(segment):
+                    return (getattr(segment, 'start', 0), getattr(segment, 'end', 0),
+                            getattr(segment, 'text', ''))
+
+            format_timestamp = self._format_timestamp
+            output_lines.extend([
+                f"[{format_timestamp(start)} -> {format_timestamp(end)}] {text}"
+                for start, end, text in map(fields, segments)
+            ])
 
         return "\n".join(output_lines)
 
@@ -127,27 +252,142 @@ class TranscriptionService:
         Returns:
             Formatted timestamp string
         """
-        minutes = int(seconds // 60)
-        secs = int(seconds % 60)
+        minutes, secs = divmod(int(seconds), 60)
         return f"{minutes:02d}:{secs:02d}"
 
     def transcribe_audio(
         self,
-        audio_file_path: str,
+        audio_file: Union[str, BinaryIO, bytes],
         model: str = "gpt-4o-mini-transcribe",
         language: Optional[str] = None,
         timestamp_granularities: Optional[List[str]] = None,
-        response_format: str = "text"
+        response_format: str = "text",
+        filename: Optional[str] = None
     ) -> Tuple[Optional[str], str]:
         """
-        Transcribe an audio file using OpenAI API.
+        Transcribe audio using OpenAI API.
+
+        Args:
+            audio_file: Path to the audio file, an open binary file, or the encoded
+                audio bytes (e.g. compressed output already in memory)
+            model: Model to use for transcription
+            language: Optional language code (e.g., 'en', 'ko')
+            timestamp_granularities: List of timestamp types ["segment", "word"]
+            response_format: Response format ("text", "verbose_json", "vtt", "srt")
+            filename: Name sent for file objects/bytes (its extension tells the API
+                the format); defaults to the file object's name or "audio.opus"
+
+        Returns:
+            Tuple of (transcription_text: Optional[str], status_message: str)
+        """
+        try:
+            if not self.is_configured():
+                return None, "API key not configured. Please set your OpenAI API key first."
+
+            if isinstance(audio_file, str):
+                error = self._check_upload_size(audio_file)
+                if error:
+                    return None, error
+
+                # Open and transcribe the audio file (streamed from disk; the file
+                # stays open until the request completes)
+                with open(audio_file, "rb") as f:
+                    return self._request_transcription(
+                        self._upload_file(audio_file, f),
+                        model, language, timestamp_granularities, response_format
+                    )
+
+            # In-memory audio: no disk round-trip
+            if isinstance(audio_file, (bytes, bytearray)):
+                if len(audio_file) > MAX_UPLOAD_BYTES:
+                    return None, "Audio is too large for a single OpenAI request (25 MB max)."
+                audio_file = io.BytesIO(audio_file)
+
+            name = filename or os.path.basename(getattr(audio_file, "name", "") or "audio.opus")
+            return self._request_transcription(
+                self._upload_file(name, audio_file),
+                model, language, timestamp_granularities, response_format
+            )
+
+        except Exception as e:
+            return None, self._describe_error(e)
+
+    def transcribe_audio_streaming(
+        self,
+        audio_file_path: str,
+        model: str = "gpt-4o-mini-transcribe",
+        language: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Transcribe an audio file as plain text, yielding text deltas as they arrive.
+
+        Only models in STREAMING_MODELS support this. Failures are raised rather than
+        returned as a status, since part of the text may already have been yielded.
 
         Args:
             audio_file_path: Path to the audio file
+            model: Model to use for transcription (see STREAMING_MODELS)
+            language: Optional language code (e.g., 'en', 'ko')
+
+        Yields:
+            Successive pieces of the transcription text
+
+        Raises:
+            Exception: With a user-facing message if the request fails
+        """
+        if not self.is_configured():
+            raise Exception("API key not configured. Please set your OpenAI API key first.")
+        if model not in STREAMING_MODELS:
+            raise Exception(f"Model does not support streaming: {model}")
+
+        error = self._check_upload_size(audio_file_path)
+        if error:
+            raise Exception(error)
+
+        try:
+            with open(audio_file_path, "rb") as f:
+                audio_file = self._upload_file(audio_file_path, f)
+                transcribe_params = self._build_request(audio_file, model, language, None, "text")
+
+                # Errors such as rate limits surface before the first event, so retry
+                # only the request itself
+                client = self.client.with_options(max_retries=0)
+                events = self._with_retries(
+                    lambda: client.audio.transcriptions.create(**transcribe_params, stream=True),
+                    audio_file
+                )
+
+                for event in events:
+                    if event.type == "transcript.text.delta":
+                        yield event.delta
+        except Exception as e:
+            raise Exception(self._describe_error(e)) from e
+
+    def transcribe_stream(
+        self,
+        audio_stream: BinaryIO,
+        filename: str,
+        model: str = "gpt-4o-mini-transcribe",
+        language: Optional[str] = None,
+        timestamp_granularities: Optional[List[str]] = None,
+        response_format: str = "text",
+        mime_type: str = "application/octet-stream"
+    ) -> Tuple[Optional[str], str]:
+        """
+        Transcribe audio read from a stream (e.g. FFmpeg's stdout) without a temp file.
+
+        A non-seekable stream such as a pipe is read into memory first: httpx sizes
+        file fields with fstat, which reports 0 for a pipe, and a consumed pipe could
+        not be re-sent on retry. This suits single-request uploads (under the size limit).
+
+        Args:
+            audio_stream: Binary file-like object with the encoded audio
+            filename: File name sent to the API; its extension tells the API the format
             model: Model to use for transcription
             language: Optional language code (e.g., 'en', 'ko')
             timestamp_granularities: List of timestamp types ["segment", "word"]
             response_format: Response format ("text", "verbose_json", "vtt", "srt")
+            mime_type: MIME type of the audio
 
         Returns:
             Tuple of (transcription_text: Optional[str], status_message: str)
@@ -156,69 +396,216 @@ class TranscriptionService:
             if not self.is_configured():
                 return None, "API key not configured. Please set your OpenAI API key first."
 
-            if not os.path.exists(audio_file_path):
-                return None, "Audio file not found."
-
-            # Check if model is valid
-            if model not in TRANSCRIPTION_MODELS:
-                return None, f"Invalid model: {model}"
-
-            # Check if model supports verbose_json format
-            model_info = TRANSCRIPTION_MODELS[model]
-            supports_verbose = model_info.get("supports_verbose_json", False)
-
-            # Adjust response format if model doesn't support verbose_json
-            actual_format = response_format
-            if response_format == "verbose_json" and not supports_verbose:
-                actual_format = "text"
-                print(f"Note: {model} doesn't support verbose_json format. Using 'text' format instead.")
-
-            # Open and transcribe the audio file
-            with open(audio_file_path, "rb") as audio_file:
-                # Prepare transcription parameters
-                transcribe_params = {
-                    "file": audio_file,
-                    "model": model,
-                    "response_format": actual_format,
-                }
-
-                # Add language if specified
-                if language:
-                    transcribe_params["language"] = language
-
-                # Add timestamp granularities only if using verbose_json
-                if timestamp_granularities and actual_format == "verbose_json":
-                    transcribe_params["timestamp_granularities"] = timestamp_granularities
-
-                # Call OpenAI API
-                transcript = self.client.audio.transcriptions.create(**transcribe_params)
-
-                # Handle different response formats
-                if actual_format == "text":
-                    transcription_text = transcript
-                elif actual_format == "verbose_json":
-                    # Format verbose JSON response with timestamps
-                    transcription_text = self._format_verbose_json(transcript)
-                else:  # vtt, srt
-                    transcription_text = transcript
-
-                if not transcription_text:
-                    return None, "Transcription returned empty result."
-
-                return transcription_text, "Transcription completed successfully."
+            if not audio_stream.seekable():
+                audio_stream = io.BytesIO(audio_stream.read())
+
+            return self._request_transcription(
+                (filename, audio_stream, mime_type),
+                model, language, timestamp_granularities, response_format
+            )
 
         except Exception as e:
-            error_message = str(e)
-
-            # Provide more specific error messages
-            if "invalid_api_key" in error_message.lower():
-                return None, "Invalid API key. Please check your OpenAI API key."
-            elif "insufficient_quota" in error_message.lower():
-                return None, "Insufficient quota. Please check your OpenAI account billing."
-            elif "rate_limit" in error_message.lower():
-                return None, "Rate limit exceeded. Please try again later."
-            else:
-                return None, f"Error during transcription: {error_message}"
+            return None, self._describe_error(e)
+
+    def _request_transcription(
+        self,
+        audio_file,
+        model: str,
+        language: Optional[str],
+        timestamp_granularities: Optional[List[str]],
+        response_format: str
+    ) -> Tuple[Optional[str], str]:
+        """Send one transcription request; audio_file is anything the OpenAI client accepts."""
+        # Check if model is valid
+        if model not in TRANSCRIPTION_MODELS:
+            return None, f"Invalid model: {model}"
+
+        actual_format = self._resolve_response_format(model, response_format)
+        transcribe_params = self._build_request(
+            audio_file, model, language, timestamp_granularities, actual_format
+        )
+
+        # Call OpenAI API, backing off on rate limits and timeouts
+        client = self.client.with_options(max_retries=0)
+        transcript = self._with_retries(
+            lambda: client.audio.transcriptions.create(**transcribe_params), audio_file
+        )
+
+        return self._format_result(transcript, actual_format)
+
+    async def _request_transcription_async(
+        self,
+        client: AsyncOpenAI,
+        audio_file,
+        model: str,
+        language: Optional[str],
+        timestamp_granularities: Optional[List[str]],
+        response_format: str
+    ) -> Tuple[Optional[str], str]:
+        """
+        Async counterpart of _request_transcription using an AsyncOpenAI client.
+
+        The batch validates model and resolves response_format with
+        _resolve_response_format once, before any chunk is submitted.
+        """
+        transcribe_params = self._build_request(
+            audio_file, model, language, timestamp_granularities, response_format
+        )
+
+        client = client.with_options(max_retries=0)
+        transcript = await self._with_retries_async(
+            lambda: client.audio.transcriptions.create(**transcribe_params), audio_file
+        )
+
+        return self._format_result(transcript, response_format)
+
+    @staticmethod
+    def _resolve_response_format(model: str, response_format: str) -> str:
+        """Fall back to 'text' (with a note) if the model doesn't support verbose_json."""
+        if response_format == "verbose_json" and model not in VERBOSE_JSON_MODELS:
+            print(f"Note: {model} doesn't support verbose_json format. Using 'text' format instead.")
+            return "text"
+        return response_format
+
+    @staticmethod
+    def _build_request(
+        audio_file,
+        model: str,
+        language: Optional[str],
+        timestamp_granularities: Optional[List[str]],
+        actual_format: str
+    ) -> dict:
+        """Build the transcriptions.create() parameters for a request."""
+        # Prepare transcription parameters
+        transcribe_params = {
+            "file": audio_file,
+            "model": model,
+            "response_format": actual_format,
+        }
+
+        # Add language if specified
+        if language:
+            transcribe_params["language"] = language
+
+        # Add timestamp granularities only if using verbose_json
+        if timestamp_granularities and actual_format == "verbose_json":
+            transcribe_params["timestamp_granularities"] = timestamp_granularities
+
+        return transcribe_params
+
+    def _format_result(self, transcript, actual_format: str) -> Tuple[Optional[str], str]:
+        """Convert an API response into (transcription_text, status_message)."""
+        # Handle different response formats
+        if actual_format == "text":
+            transcription_text = transcript
+        elif actual_format == "verbose_json":
+            # Format verbose JSON response with timestamps
+            transcription_text = self._format_verbose_json(transcript)
+        else:  # vtt, srt
+            transcription_text = transcript
+
+        if not transcription_text:
+            return None, "Transcription returned empty result."
+
+        return transcription_text, "Transcription completed successfully."
+
+    @staticmethod
+    def _check_upload_size(audio_file_path: str) -> Optional[str]:
+        """
+        Check that a file exists and fits the API upload limit, with a single stat.
+
+        Returns:
+            Error message, or None if the file can be uploaded
+        """
+        try:
+            size = os.stat(audio_file_path).st_size
+        except FileNotFoundError:
+            return "Audio file not found."
+
+        if size == 0:
+            return "Audio file is empty."
+        if size > MAX_UPLOAD_BYTES:
+            return (f"Audio file is too large ({size / (1024 * 1024):.1f} MB). "
+                    f"OpenAI accepts up to {MAX_UPLOAD_BYTES // (1024 * 1024)} MB; enable compression.")
+        return None
+
+    @staticmethod
+    def _upload_file(audio_file_path: str, audio_file: BinaryIO) -> Tuple[str, BinaryIO, str]:
+        """
+        Wrap an open audio file as a (name, file, content type) upload.
+
+        Passing a tuple lets httpx stream the body from the file in chunks.
+        """
+        extension = os.path.splitext(audio_file_path)[1].lower()
+        mime_type = AUDIO_MIME_TYPES.get(extension, "application/octet-stream")
+        return os.path.basename(audio_file_path), audio_file, mime_type
+
+    @classmethod
+    def _with_retries(cls, call: Callable[[], T], audio_file) -> T:
+        """Run call(), backing off and retrying on rate limits and timeouts."""
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                return call()
+            except RETRYABLE_ERRORS as e:
+                if not cls._should_retry(e, attempt, audio_file):
+                    raise
+                time.sleep(cls._backoff_delay(attempt))
+
+    @classmethod
+    async def _with_retries_async(cls, call: Callable[[], Awaitable[T]], audio_file) -> T:
+        """Async counterpart of _with_retries; call() must return a fresh awaitable."""
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                return await call()
+            except RETRYABLE_ERRORS as e:
+                if not cls._should_retry(e, attempt, audio_file):
+                    raise
+                await asyncio.sleep(cls._backoff_delay(attempt))
+
+    @staticmethod
+    def _backoff_delay(attempt: int) -> float:
+        """Random exponential backoff for the given retry attempt."""
+        delay = min(RETRY_MAX_DELAY, RETRY_MIN_DELAY * 2 ** attempt)
+        return max(RETRY_MIN_DELAY, random.uniform(0, delay))
+
+    @classmethod
+    def _should_retry(cls, error: Exception, attempt: int, audio_file) -> bool:
+        """Decide whether a retryable API error should be retried."""
+        if attempt >= MAX_RETRIES:
+            return False
+        # Exhausted quota is also reported as a 429 but won't recover by waiting
+        if getattr(error, "code", None) == "insufficient_quota":
+            return False
+        # A consumed stream can't be re-sent, so only retry rewindable files
+        return cls._rewind(audio_file)
+
+    @staticmethod
+    def _rewind(audio_file) -> bool:
+        """Seek a file object back to the start; returns False if it can't be re-read."""
+        if isinstance(audio_file, tuple):
+            audio_file = audio_file[1]
+        try:
+            if audio_file.seekable():
+                audio_file.seek(0)
+                return True
+        except (AttributeError, OSError):
+            pass
+        return False
+
+    @staticmethod
+    def _describe_error(error: Exception) -> str:
+        """Turn an API exception into a user-facing error message."""
+        error_message = str(error)
+
+        # Provide more specific error messages
+        if "invalid_api_key" in error_message.lower():
+            return "Invalid API key. Please check your OpenAI API key."
+        elif "insufficient_quota" in error_message.lower():
+            return "Insufficient quota. Please check your OpenAI account billing."
+        elif "rate_limit" in error_message.lower():
+            return "Rate limit exceeded. Please try again later."
+        else:
+            return f"Error during transcription: {error_message}"
 
     @staticmethod
     def get_model_info() -> dict:
@@ -227,91 +614,182 @@ class TranscriptionService:
 
     def transcribe_chunks_batch(
         self,
-        chunk_paths: List[str],
+        chunk_paths: Iterable[str],
         model: str = "gpt-4o-mini-transcribe",
         language: Optional[str] = None,
         timestamp_granularities: Optional[List[str]] = None,
         response_format: str = "text",
-        progress_callback: Optional[Callable[[int, int, str], None]] = None
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        total_chunks: Optional[int] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        max_concurrent: int = 8,
+        output_stream: Optional[TextIO] = None,
+        async_client: Optional[AsyncOpenAI] = None
     ) -> Tuple[List[Optional[str]], List[str]]:
         """
         Transcribe multiple audio chunks in parallel.
 
+        Requests run as coroutines on an asyncio event loop in a background thread,
+        while this (calling) thread consumes chunk_paths and reports progress. Chunks
+        are submitted as soon as they are yielded, so chunk_paths may be a generator
+        that is still producing chunks while earlier ones are transcribed.
+
         Args:
-            chunk_paths: List of audio file paths
+            chunk_paths: Audio file paths (list or generator)
             model: Model to use for transcription
             language: Optional language code
             timestamp_granularities: List of timestamp types
             response_format: Response format
-            progress_callback: Optional callback(current, total, message)
+            progress_callback: Optional callback(current, total, message), called
+                from the calling thread
+            total_chunks: Number of chunks (required if chunk_paths has no len())
+            loop: Optional shared event loop, already running in another thread. It
+                is left running; when omitted, a temporary loop thread is used
+            max_concurrent: Maximum number of requests in flight for this batch
+            output_stream: Optional text stream that receives each successful chunk's
+                text (plus a newline) in chunk order as soon as all earlier chunks
+                have finished, without overlap removal
+            async_client: Optional AsyncOpenAI client for this service's key, reused
+                across batches so its keep-alive connections survive. It must only be
+                used on `loop` and is left open; when omitted, a client is created and
+                closed per batch
 
         Returns:
-            Tuple of (transcription_list, error_messages)
+            Tuple of (transcription_list, error_messages), both in chunk order
+            (failed chunks are None in transcription_list)
         """
         if not self.is_configured():
             return [], ["API key not configured"]
 
-        total_chunks = len(chunk_paths)
-        transcriptions = []
-        errors = []
+        if model not in TRANSCRIPTION_MODELS:
+            return [], [f"Invalid model: {model}"]
 
-        # Use ThreadPoolExecutor for parallel API calls
-        with ThreadPoolExecutor(max_workers=min(5, total_chunks)) as executor:
-            futures = []
+        if total_chunks is None:
+            total_chunks = len(chunk_paths)
 
+        # A single chunk gains nothing from the loop thread and a per-batch async client
+        if total_chunks == 1:
+            chunk_paths = list(chunk_paths)
+            if len(chunk_paths) == 1:
+                text, status = self.transcribe_audio(
+                    chunk_paths[0], model, language, timestamp_granularities, response_format
+                )
+                if progress_callback:
+                    outcome = "Completed" if text else "Error in"
+                    progress_callback(1, 1, f"{outcome} chunk 1 (1/1 done)")
+                if text and output_stream is not None:
+                    output_stream.write(text + "\n")
+                return [text or None], [] if text else [f"Chunk 1: {status}"]
+
+        # Resolve the format once so the fallback note is printed once per batch
+        response_format = self._resolve_response_format(model, response_format)
+
+        owns_loop = loop is None
+        if owns_loop:
+            loop = asyncio.new_event_loop()
+            loop_thread = threading.Thread(target=loop.run_forever, name="trx-loop", daemon=True)
+            loop_thread.start()
+
+        # Without a shared client, use one per batch: async clients are tied to the
+        # loop they run on
+        owns_client = async_client is None
+        client = create_async_openai_client(self.api_key) if owns_client else async_client
+        limiter = asyncio.Semaphore(max(1, max_concurrent))
+        future_to_index = {}
+
+        try:
             for i, chunk_path in enumerate(chunk_paths):
-                future = executor.submit(
-                    self.transcribe_audio,
-                    chunk_path,
-                    model,
-                    language,
-                    timestamp_granularities,
-                    response_format
+                future = asyncio.run_coroutine_threadsafe(
+                    self._transcribe_audio_async(
+                        client,
+                        limiter,
+                        chunk_path,
+                        model,
+                        language,
+                        timestamp_granularities,
+                        response_format
+                    ),
+                    loop
                 )
-                futures.append((i, future))
+                future_to_index[future] = i
+
+            # Slots keep results in chunk order while progress is reported as soon
+            # as any chunk finishes
+            transcriptions: List[Optional[str]] = [None] * len(future_to_index)
+            finished = [False] * len(future_to_index)
+            next_to_write = 0
+            chunk_errors = {}
 
-            # Collect results
-            for i, future in futures:
+            for completed, future in enumerate(as_completed(future_to_index), start=1):
+                i = future_to_index[future]
                 try:
                     text, status = future.result()
 
                     if text:
-                        transcriptions.append(text)
-                        if progress_callback:
-                            progress_callback(
-                                i + 1,
-                                total_chunks,
-                                f"Completed chunk {i + 1}/{total_chunks}"
-                            )
+                        transcriptions[i] = text
+                        message = f"Completed chunk {i + 1} ({completed}/{total_chunks} done)"
                     else:
-                        transcriptions.append(None)
-                        errors.append(f"Chunk {i + 1}: {status}")
-                        if progress_callback:
-                            progress_callback(
-                                i + 1,
-                                total_chunks,
-                                f"Error in chunk {i + 1}/{total_chunks}"
-                            )
+                        chunk_errors[i] = f"Chunk {i + 1}: {status}"
+                        message = f"Error in chunk {i + 1} ({completed}/{total_chunks} done)"
 
                 except Exception as e:
-                    transcriptions.append(None)
-                    errors.append(f"Chunk {i + 1}: {str(e)}")
-                    if progress_callback:
-                        progress_callback(
-                            i + 1,
-                            total_chunks,
-                            f"Error in chunk {i + 1}/{total_chunks}"
-                        )
+                    chunk_errors[i] = f"Chunk {i + 1}: {str(e)}"
+                    message = f"Error in chunk {i + 1} ({completed}/{total_chunks} done)"
+
+                if progress_callback:
+                    progress_callback(completed, total_chunks, message)
+
+                # Flush the contiguous run of finished chunks. Results are handled on
+                # this thread only, so no lock is needed
+                finished[i] = True
+                if output_stream is not None:
+                    while next_to_write < len(finished) and finished[next_to_write]:
+                        if transcriptions[next_to_write]:
+                            output_stream.write(transcriptions[next_to_write] + "\n")
+                        next_to_write += 1
+
+            errors = [chunk_errors[i] for i in sorted(chunk_errors)]
+        finally:
+            # Stop outstanding requests if producing chunks failed part-way
+            for future in future_to_index:
+                future.cancel()
+            if owns_client:
+                asyncio.run_coroutine_threadsafe(client.close(), loop).result()
+            if owns_loop:
+                loop.call_soon_threadsafe(loop.stop)
+                loop_thread.join()
+                loop.close()
 
         return transcriptions, errors
 
+    async def _transcribe_audio_async(
+        self,
+        client: AsyncOpenAI,
+        limiter: asyncio.Semaphore,
+        audio_file_path: str,
+        model: str,
+        language: Optional[str],
+        timestamp_granularities: Optional[List[str]],
+        response_format: str
+    ) -> Tuple[Optional[str], str]:
+        """Transcribe one chunk on the event loop, holding a slot of the batch's limiter."""
+        try:
+            error = self._check_upload_size(audio_file_path)
+            if error:
+                return None, error
+
+            async with limiter:
+                with open(audio_file_path, "rb") as audio_file:
+                    return await self._request_transcription_async(
+                        client,
+                        self._upload_file(audio_file_path, audio_file),
+                        model, language, timestamp_granularities, response_format
+                    )
+
+        except Exception as e:
+            return None, self._describe_error(e)
+
     @staticmethod
-    def get_model_choices() -> list:
+    def get_model_choices() -> Tuple[Tuple[str, str], ...]:
         """Get list of model choices for UI dropdown."""
-        choices = []
-        for model_id, info in TRANSCRIPTION_MODELS.items():
-            label = f"{info['name']} - {info['price']}"
-            if info.get('default'):
-                label += " (Default)"
-            choices.append((label, model_id))
-        return choices
+        return MODEL_CHOICES
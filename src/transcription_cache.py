@@ -0,0 +1,129 @@
+"""On-disk cache of transcriptions keyed by audio content and transcription options."""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Optional, Tuple
+
+
+DEFAULT_CACHE_DIR = os.path.join("~", ".cache", "ai-meeting-notes", "transcriptions")
+DEFAULT_MAX_BYTES = 1024 ** 3  # 1 GB
+
+
+class TranscriptionCache:
+    """Store finished transcriptions so re-transcribing the same audio is a disk read."""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = os.path.expanduser(cache_dir)
+        self.max_bytes = max_bytes
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(audio_filepath: str, **options) -> str:
+        """
+        Build a cache key from the audio content and the options that shape the result.
+
+        Args:
+            audio_filepath: Path to the audio file (hashed in 1 MiB chunks)
+            **options: Settings affecting the transcript (model, language, format, ...)
+
+        Returns:
+            SHA-256 hex digest identifying this audio + options combination
+        """
+        hasher = hashlib.sha256()
+        with open(audio_filepath, 'rb') as f:
+            while chunk := f.read(1 << 20):
+                hasher.update(chunk)
+        hasher.update(json.dumps(options, sort_keys=True).encode())
+        return hasher.hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        """Get the file path of a cache entry."""
+        return os.path.join(self.cache_dir, f"{key}.txt")
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached transcription.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            The cached transcription, or None on a miss
+        """
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                text = f.read()
+            # Touch explicitly: atime is unreliable (noatime/relatime mounts)
+            os.utime(entry_path)
+            return text
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Warning: Could not read transcription cache entry: {e}")
+            return None
+
+    def put(self, key: str, text: str):
+        """
+        Store a transcription, then evict least recently used entries over max_bytes.
+
+        Args:
+            key: Cache key from make_key
+            text: Transcription text
+        """
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(text)
+                os.replace(temp_path, self._entry_path(key))
+            except Exception:
+                os.remove(temp_path)
+                raise
+            self._evict()
+        except Exception as e:
+            print(f"Warning: Could not write transcription cache entry: {e}")
+
+    def _evict(self):
+        """Remove least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        total_bytes = 0
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith(".txt"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                    total_bytes += stat.st_size
+
+        if total_bytes <= self.max_bytes:
+            return
+
+        entries.sort()
+        for _, size, path in entries:
+            try:
+                os.remove(path)
+                total_bytes -= size
+            except FileNotFoundError:
+                pass
+            if total_bytes <= self.max_bytes:
+                break
+
+    def clear(self) -> Tuple[bool, str]:
+        """
+        Delete all cached transcriptions.
+
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        try:
+            removed = 0
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.is_file() and entry.name.endswith(".txt"):
+                        os.remove(entry.path)
+                        removed += 1
+            return True, f"Cleared {removed} cached transcription(s)."
+        except Exception as e:
+            return False, f"Error clearing transcription cache: {str(e)}"